@@ -2,9 +2,17 @@
 LLM Agent for playing MTG.
 Uses tool calling with optional LLM backends.
 """
+import asyncio
 import json
 import os
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from enum import IntFlag
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterable, List, Dict, Any, Optional, Tuple
 
 from core.game_state import GameState
 from core.rules_engine import RulesEngine
@@ -17,6 +25,7 @@ from tools.game_tools import (
     GetStackStateTool,
     CanRespondTool,
     GetPendingTriggersTool,
+    GetFullContextTool,
 )
 from tools.evaluation_tools import (
     EvaluatePositionTool,
@@ -27,11 +36,10 @@ from tools.evaluation_tools import (
     RecommendCombatTargetsTool,
 )
 
-# Optional provider SDKs
-try:
-    from openai import OpenAI  # type: ignore
-except Exception:
-    OpenAI = None  # type: ignore
+# Optional provider SDKs. The openai package is imported on first use (see
+# _load_openai) so heuristic-only runs never pay for its import graph.
+_NOT_LOADED = object()
+OpenAI: Any = _NOT_LOADED
 
 try:
     from anthropic import Anthropic  # type: ignore
@@ -39,6 +47,213 @@ except Exception:
     Anthropic = None  # type: ignore
 
 
+def _load_openai() -> Optional[Any]:
+    """Return the OpenAI client class, importing it once; None if not installed."""
+    global OpenAI
+    if OpenAI is _NOT_LOADED:
+        try:
+            from openai import OpenAI as client_class  # type: ignore
+        except Exception:
+            client_class = None
+        OpenAI = client_class
+    return OpenAI
+
+
+@dataclass(slots=True, frozen=True)
+class ToolSet:
+    """The agent's fixed set of tools, one slot per tool name."""
+    get_game_state: GetGameStateTool
+    get_legal_actions: GetLegalActionsTool
+    execute_action: ExecuteActionTool
+    analyze_threats: AnalyzeThreatsTool
+    get_stack_state: GetStackStateTool
+    can_respond: CanRespondTool
+    get_pending_triggers: GetPendingTriggersTool
+    get_full_context: GetFullContextTool
+    evaluate_position: EvaluatePositionTool
+    can_i_win: CanIWinTool
+    recommend_strategy: StrategyRecommendationTool
+    analyze_opponent: OpponentModelingTool
+    get_turn_history: GetTurnHistoryTool
+    recommend_combat_targets: RecommendCombatTargetsTool
+
+    def as_mapping(self) -> "MappingProxyType[str, Any]":
+        """Read-only name -> tool view, for dispatching LLM tool calls by name."""
+        return MappingProxyType({f.name: getattr(self, f.name) for f in fields(self)})
+
+
+class StrategicTool(IntFlag):
+    """Strategic tools tracked for Chain-of-Thought enforcement, one bit each."""
+    EVALUATE_POSITION = 1
+    ANALYZE_OPPONENT = 2
+    RECOMMEND_STRATEGY = 4
+    CAN_I_WIN = 8
+    ANALYZE_THREATS = 16
+
+
+_STRATEGIC_TOOL_FLAGS: Dict[str, StrategicTool] = {flag.name.lower(): flag for flag in StrategicTool}
+_REQUIRED_STRATEGIC_TOOLS = StrategicTool.EVALUATE_POSITION  # Always need position awareness
+_RECOMMENDED_STRATEGIC_TOOLS = (
+    StrategicTool.ANALYZE_OPPONENT | StrategicTool.RECOMMEND_STRATEGY | StrategicTool.ANALYZE_THREATS
+)
+
+
+class _RequestRateLimiter:
+    """Thread-safe token bucket capping LLM requests per minute across agents."""
+
+    def __init__(self, requests_per_minute: float, clock=time.monotonic, sleep=time.sleep) -> None:
+        self.capacity = requests_per_minute
+        self.rate = requests_per_minute / 60.0  # tokens per second
+        self.tokens = requests_per_minute
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        with self._lock:
+            now = self._clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve a token even if it is not there yet; later callers queue behind us
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+
+
+# One limiter per configured rate, shared by every agent in the process
+_RATE_LIMITERS: Dict[float, _RequestRateLimiter] = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+def _shared_rate_limiter() -> Optional[_RequestRateLimiter]:
+    """Return the process-wide limiter for LLM_MAX_REQUESTS_PER_MINUTE, if set."""
+    raw = os.getenv("LLM_MAX_REQUESTS_PER_MINUTE", "0")
+    try:
+        requests_per_minute = float(raw or 0)
+    except ValueError:
+        print(f"⚠️  Warning: LLM_MAX_REQUESTS_PER_MINUTE={raw!r} is not a number. Running without a rate limit.")
+        return None
+    if requests_per_minute <= 0:
+        return None
+    with _RATE_LIMITERS_LOCK:
+        limiter = _RATE_LIMITERS.get(requests_per_minute)
+        if limiter is None:
+            limiter = _RATE_LIMITERS[requests_per_minute] = _RequestRateLimiter(requests_per_minute)
+        return limiter
+
+
+def _build_tool_schemas() -> Tuple[Dict[str, Any], ...]:
+    """Convert tools to OpenAI/compatible function calling schemas."""
+    schemas: List[Dict[str, Any]] = []
+
+    # Helpers to build basic empty-arg schemas
+    def simple_schema(name: str, description: str) -> Dict[str, Any]:
+        return {
+            "type": "function",
+            "function": {
+                "name": name,
+                "description": description,
+                "parameters": {"type": "object", "properties": {}, "required": []},
+            },
+        }
+
+    # Core/simple tools
+    schemas.append(simple_schema("get_game_state", "Get the current game state including turn, phase, players' life totals, hand, battlefield, and stack."))
+    schemas.append(simple_schema("get_legal_actions", "Get all legal actions available to the active player in the current game state."))
+
+    # execute_action schema with structured action object
+    schemas.append(
+        {
+            "type": "function",
+            "function": {
+                "name": "execute_action",
+                "description": "Execute a game action. Use this to play lands, cast spells, attack, block, tap lands, or pass priority.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "action": {
+                            "type": "object",
+                            "description": "The action to execute",
+                            "properties": {
+                                "type": {"type": "string"},
+                                "card_id": {"type": "string"},
+                                "creature_id": {"type": "string"},
+                                "target_id": {"type": "string"},
+                                "blocker_id": {"type": "string"},
+                                "attacker_id": {"type": "string"},
+                                "reasoning": {"type": "string"},
+                            },
+                            "required": ["type"],
+                        }
+                    },
+                    "required": ["action"],
+                },
+            },
+        }
+    )
+
+    schemas.append(simple_schema("analyze_threats", "Analyze threats and opportunities on the battlefield."))
+    schemas.append(simple_schema("get_stack_state", "Get the current state of the stack, who has priority, and whether you can respond."))
+    schemas.append(simple_schema("can_respond", "Check if you can respond to spells on the stack by casting an instant. Returns available instants and recommendations."))
+    schemas.append(simple_schema("get_pending_triggers", "List triggered abilities that are queued or already on the stack, with controller, source, and effect."))
+    schemas.append(simple_schema("get_full_context", "Get the game state, stack, pending triggers, and threat analysis in one call instead of four."))
+
+    # Phase 2 tools expose their own schemas
+    schemas.append(EvaluatePositionTool().get_schema())
+    schemas.append(CanIWinTool().get_schema())
+    schemas.append(StrategyRecommendationTool().get_schema())
+    schemas.append(OpponentModelingTool().get_schema())
+
+    # Phase 5a.3: Turn history tool
+    schemas.append(GetTurnHistoryTool().get_schema())
+
+    # Phase 5a.4: Combat target recommendation
+    schemas.append(RecommendCombatTargetsTool().get_schema())
+
+    return tuple(schemas)
+
+
+# Tool schemas are static, so every agent shares one immutable sequence
+_TOOL_SCHEMAS = _build_tool_schemas()
+_TOOL_SCHEMAS_BY_NAME = MappingProxyType({schema["function"]["name"]: schema for schema in _TOOL_SCHEMAS})
+
+
+# Aggression guidance appended to every phase prompt
+_AGGRESSION_GUIDANCE = {
+    "aggressive": "\n**AGGRESSION LEVEL: AGGRESSIVE** - Attack with ALL creatures every turn. Maximum pressure!",
+    "balanced": "\n**AGGRESSION LEVEL: BALANCED** - Attack when advantageous (power 2+) or when behind on life.",
+    "conservative": "\n**AGGRESSION LEVEL: CONSERVATIVE** - Only attack with strong creatures (power 3+) or when desperate."
+}
+
+
+@lru_cache(maxsize=None)
+def _phase_prompt(phase: str, step: str, aggression: str) -> str:
+    """Build the phase-specific prompt; there are only a few dozen distinct inputs."""
+    if step in ["declare_attackers", "declare_blockers"]:
+        base_prompt = COMBAT_PROMPT.format(step=step.upper())
+    elif step == "main":
+        base_prompt = MAIN_PHASE_PROMPT
+    else:
+        base_prompt = DECISION_PROMPT.format(phase=phase, step=step)
+    return base_prompt + _AGGRESSION_GUIDANCE.get(aggression, "")
+
+
+def _combined_strategic_flags(tool_names: Iterable[str]) -> int:
+    """OR together the StrategicTool bits of the named tools (non-strategic tools add nothing)."""
+    mask = 0
+    for name in tool_names:
+        mask |= _STRATEGIC_TOOL_FLAGS.get(name, 0)
+    return mask
+
+
+def _strategic_tool_names(mask: int) -> List[str]:
+    """Decode a strategic tool bitmask into tool names."""
+    return [name for name, flag in _STRATEGIC_TOOL_FLAGS.items() if mask & flag]
+
+
 class MTGAgent:
     """Agent that uses tools and optionally an LLM to make decisions."""
 
@@ -72,6 +287,7 @@ class MTGAgent:
         )
         self.thinking_mode = os.getenv("LLM_THINKING", "false").lower() in ("1", "true", "yes", "on")
         self.reasoning_effort = os.getenv("LLM_REASONING_EFFORT", "medium")
+        self._rate_limiter = _shared_rate_limiter()
 
         # Initialize LLM client if not provided
         if use_llm is False:
@@ -83,15 +299,22 @@ class MTGAgent:
             self.use_llm = bool(self.llm_client) if use_llm is None else bool(use_llm and self.llm_client)
 
         # Set up tools and prompts
-        self.tools = self._setup_tools()
+        self._tool_set = self._setup_tools()
+        self.tools = self._tool_set.as_mapping()
         self.messages: List[Dict[str, Any]] = [{"role": "system", "content": SYSTEM_PROMPT}]
         
         # Phase 5: Chain-of-Thought enforcement
-        self._strategic_tools_called: set = set()  # Track which strategic tools were called this decision
+        self._strategic_mask = 0  # StrategicTool bits called this decision
+        # Tool name -> StrategicTool bits it covers; bundles count for the snapshots they include
+        self._strategic_flags_by_tool: Dict[str, int] = dict(_STRATEGIC_TOOL_FLAGS)
+        self._strategic_flags_by_tool["get_full_context"] = _combined_strategic_flags(
+            tool.name for tool in self._tool_set.get_full_context.sections.values()
+        )
+        self._cot_satisfied = False  # Latched once the mask meets the requirements
         self._cot_enforcement_enabled = os.getenv("COT_ENFORCEMENT", "true").lower() in ("1", "true", "yes", "on")
         self._min_strategic_tools = int(os.getenv("MIN_STRATEGIC_TOOLS", "3"))  # Minimum strategic tools before action
 
-    def _setup_tools(self) -> Dict[str, Any]:
+    def _setup_tools(self) -> ToolSet:
         """Instantiate and wire all tools used by the agent."""
         tools: Dict[str, Any] = {}
 
@@ -103,6 +326,12 @@ class MTGAgent:
         tools["get_stack_state"] = GetStackStateTool(game_state=self.game_state, rules_engine=self.rules_engine)
         tools["can_respond"] = CanRespondTool(game_state=self.game_state, rules_engine=self.rules_engine)
         tools["get_pending_triggers"] = GetPendingTriggersTool(game_state=self.game_state, rules_engine=self.rules_engine)
+        tools["get_full_context"] = GetFullContextTool(sections={
+            "game_state": tools["get_game_state"],
+            "stack": tools["get_stack_state"],
+            "triggers": tools["get_pending_triggers"],
+            "threats": tools["analyze_threats"],
+        })
 
         # Phase 2 evaluation tools
         eval_tool = EvaluatePositionTool()
@@ -131,76 +360,15 @@ class MTGAgent:
         combat_tool.game_state = self.game_state
         tools["recommend_combat_targets"] = combat_tool
 
-        return tools
-
-    def _get_tool_schemas(self) -> List[Dict[str, Any]]:
-        """Convert tools to OpenAI/compatible function calling schemas."""
-        schemas: List[Dict[str, Any]] = []
+        return ToolSet(**tools)
 
-        # Helpers to build basic empty-arg schemas
-        def simple_schema(name: str, description: str) -> Dict[str, Any]:
-            return {
-                "type": "function",
-                "function": {
-                    "name": name,
-                    "description": description,
-                    "parameters": {"type": "object", "properties": {}, "required": []},
-                },
-            }
+    def _get_tool_schemas(self) -> Tuple[Dict[str, Any], ...]:
+        """Return the OpenAI/compatible function calling schemas (built once at import)."""
+        return _TOOL_SCHEMAS
 
-        # Core/simple tools
-        schemas.append(simple_schema("get_game_state", "Get the current game state including turn, phase, players' life totals, hand, battlefield, and stack."))
-        schemas.append(simple_schema("get_legal_actions", "Get all legal actions available to the active player in the current game state."))
-
-        # execute_action schema with structured action object
-        schemas.append(
-            {
-                "type": "function",
-                "function": {
-                    "name": "execute_action",
-                    "description": "Execute a game action. Use this to play lands, cast spells, attack, block, tap lands, or pass priority.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "action": {
-                                "type": "object",
-                                "description": "The action to execute",
-                                "properties": {
-                                    "type": {"type": "string"},
-                                    "card_id": {"type": "string"},
-                                    "creature_id": {"type": "string"},
-                                    "target_id": {"type": "string"},
-                                    "blocker_id": {"type": "string"},
-                                    "attacker_id": {"type": "string"},
-                                    "reasoning": {"type": "string"},
-                                },
-                                "required": ["type"],
-                            }
-                        },
-                        "required": ["action"],
-                    },
-                },
-            }
-        )
-
-        schemas.append(simple_schema("analyze_threats", "Analyze threats and opportunities on the battlefield."))
-        schemas.append(simple_schema("get_stack_state", "Get the current state of the stack, who has priority, and whether you can respond."))
-        schemas.append(simple_schema("can_respond", "Check if you can respond to spells on the stack by casting an instant. Returns available instants and recommendations."))
-        schemas.append(simple_schema("get_pending_triggers", "List triggered abilities that are queued or already on the stack, with controller, source, and effect."))
-
-        # Phase 2 tools expose their own schemas
-        schemas.append(self.tools["evaluate_position"].get_schema())
-        schemas.append(self.tools["can_i_win"].get_schema())
-        schemas.append(self.tools["recommend_strategy"].get_schema())
-        schemas.append(self.tools["analyze_opponent"].get_schema())
-        
-        # Phase 5a.3: Turn history tool
-        schemas.append(self.tools["get_turn_history"].get_schema())
-        
-        # Phase 5a.4: Combat target recommendation
-        schemas.append(self.tools["recommend_combat_targets"].get_schema())
-
-        return schemas
+    def _get_tool_schema(self, name: str) -> Dict[str, Any]:
+        """Return the function calling schema for one tool by name."""
+        return _TOOL_SCHEMAS_BY_NAME[name]
 
     def _initialize_llm_client(self) -> Optional[Any]:
         """Initialize LLM client based on environment configuration."""
@@ -208,13 +376,14 @@ class MTGAgent:
 
         try:
             if provider == "openrouter":
-                if OpenAI is None:
-                    raise ImportError("openai package not installed. Run: pip install openai")
-
                 api_key = os.getenv("OPENROUTER_API_KEY")
                 if not api_key:
                     print("⚠️  Warning: OPENROUTER_API_KEY not set. Using fallback heuristics.")
                     return None
+
+                client_class = _load_openai()
+                if client_class is None:
+                    raise ImportError("openai package not installed. Run: pip install openai")
                 default_headers = {
                     "HTTP-Referer": "https://github.com/mtg-player",
                     "X-Title": "MTG AI Player",
@@ -222,18 +391,19 @@ class MTGAgent:
                 if os.getenv("LLM_THINKING", "false").lower() in ("1", "true", "yes", "on"):
                     default_headers["X-OpenRouter-Reasoning"] = "true"
 
-                return OpenAI(base_url="https://openrouter.ai/api/v1", api_key=api_key, default_headers=default_headers)
+                return client_class(base_url="https://openrouter.ai/api/v1", api_key=api_key, default_headers=default_headers)
 
             elif provider == "openai":
-                if OpenAI is None:
-                    raise ImportError("openai package not installed. Run: pip install openai")
-
                 api_key = os.getenv("OPENAI_API_KEY")
                 if not api_key:
                     print("⚠️  Warning: OPENAI_API_KEY not set. Using fallback heuristics.")
                     return None
 
-                return OpenAI(api_key=api_key)
+                client_class = _load_openai()
+                if client_class is None:
+                    raise ImportError("openai package not installed. Run: pip install openai")
+
+                return client_class(api_key=api_key)
 
             elif provider == "anthropic":
                 if Anthropic is None:
@@ -247,18 +417,20 @@ class MTGAgent:
                 return Anthropic(api_key=api_key)
 
             elif provider == "ollama":
-                if OpenAI is None:
+                client_class = _load_openai()
+                if client_class is None:
                     raise ImportError("openai package not installed. Run: pip install openai")
 
                 base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434/v1")
-                return OpenAI(base_url=base_url, api_key="ollama")
+                return client_class(base_url=base_url, api_key="ollama")
 
             elif provider == "lmstudio":
-                if OpenAI is None:
+                client_class = _load_openai()
+                if client_class is None:
                     raise ImportError("openai package not installed. Run: pip install openai")
 
                 base_url = os.getenv("LMSTUDIO_BASE_URL", "http://localhost:1234/v1")
-                return OpenAI(base_url=base_url, api_key="lm-studio")
+                return client_class(base_url=base_url, api_key="lm-studio")
 
             else:
                 print(f"⚠️  Warning: Unknown LLM provider '{provider}'. Using fallback heuristics.")
@@ -318,6 +490,10 @@ class MTGAgent:
                         "temperature": 0.7,
                         "max_tokens": max_tokens,
                     }
+                    if self.llm_provider in ("openai", "openrouter"):
+                        # Let the model batch independent reads into one message;
+                        # those are then dispatched concurrently below.
+                        params["parallel_tool_calls"] = True
                     # Optional: enable provider-specific thinking/reasoning
                     if self.thinking_mode:
                         if self.llm_provider == "openai" and ("o3" in (self.model or "") or "reasoning" in (self.model or "")):
@@ -338,6 +514,8 @@ class MTGAgent:
                             tools=self._get_tool_schemas()
                         )
 
+                    if self._rate_limiter:
+                        self._rate_limiter.acquire()
                     response = self.llm_client.chat.completions.create(**params)
                     
                     message = response.choices[0].message
@@ -419,13 +597,14 @@ class MTGAgent:
                     tool_results = []
                     action_to_execute = None
                     
+                    # Run the independent read-only calls concurrently up front;
+                    # the loop below still handles results in tool_call order.
+                    prefetched = self._prefetch_read_only_tool_calls(message.tool_calls)
+                    
                     # Execute tool calls
                     for tool_call in message.tool_calls:
                         function_name = tool_call.function.name
-                        try:
-                            function_args = json.loads(tool_call.function.arguments) if tool_call.function.arguments else {}
-                        except json.JSONDecodeError:
-                            function_args = {}
+                        function_args = self._parse_tool_args(tool_call)
                         
                         if self.verbose:
                             print(f"🔧 Calling tool: {function_name}({list(function_args.keys())})")
@@ -446,7 +625,7 @@ class MTGAgent:
                                     "content": json.dumps({
                                         "success": False,
                                         "error": f"Chain-of-Thought requirement not met: {error_msg}",
-                                        "strategic_tools_called": list(self._strategic_tools_called),
+                                        "strategic_tools_called": _strategic_tool_names(self._strategic_mask),
                                         "hint": "Call evaluate_position, analyze_opponent, and recommend_strategy first"
                                     })
                                 })
@@ -456,7 +635,12 @@ class MTGAgent:
                         tool = self.tools.get(function_name)
                         if tool:
                             try:
-                                result = tool.execute(**function_args)
+                                if tool_call.id in prefetched:
+                                    result = prefetched[tool_call.id]
+                                    if isinstance(result, Exception):
+                                        raise result
+                                else:
+                                    result = tool.execute(**function_args)
                                 
                                 # Check for common player ID errors and provide helpful feedback
                                 if isinstance(result, dict) and "error" in result:
@@ -534,6 +718,8 @@ class MTGAgent:
                     # Use configurable max_tokens (same as above)
                     max_tokens = int(os.getenv("LLM_MAX_TOKENS", "4000"))
                     
+                    if self._rate_limiter:
+                        self._rate_limiter.acquire()
                     response = self.llm_client.messages.create(
                         model=self.model,
                         max_tokens=max_tokens,
@@ -560,71 +746,78 @@ class MTGAgent:
     
     def _get_phase_specific_prompt(self) -> str:
         """Get prompt specific to current game phase."""
-        step = self.game_state.current_step.value
-        phase = self.game_state.current_phase.value
-        
-        # Add aggression guidance to the prompt
-        aggression_guidance = {
-            "aggressive": "\n**AGGRESSION LEVEL: AGGRESSIVE** - Attack with ALL creatures every turn. Maximum pressure!",
-            "balanced": "\n**AGGRESSION LEVEL: BALANCED** - Attack when advantageous (power 2+) or when behind on life.",
-            "conservative": "\n**AGGRESSION LEVEL: CONSERVATIVE** - Only attack with strong creatures (power 3+) or when desperate."
-        }
-        
-        base_prompt = ""
-        if step in ["declare_attackers", "declare_blockers"]:
-            base_prompt = COMBAT_PROMPT.format(step=step.upper())
-        elif step == "main":
-            base_prompt = MAIN_PHASE_PROMPT
-        else:
-            base_prompt = DECISION_PROMPT.format(phase=phase, step=step)
-        
-        # Append aggression guidance
-        return base_prompt + aggression_guidance.get(self.aggression, "")
+        return _phase_prompt(self.game_state.current_phase.value, self.game_state.current_step.value, self.aggression)
     
+    @staticmethod
+    def _parse_tool_args(tool_call: Any) -> Dict[str, Any]:
+        """Decode a tool call's JSON arguments, treating malformed input as no arguments."""
+        try:
+            return json.loads(tool_call.function.arguments) if tool_call.function.arguments else {}
+        except json.JSONDecodeError:
+            return {}
+
+    def _prefetch_read_only_tool_calls(self, tool_calls: List[Any]) -> Dict[str, Any]:
+        """
+        Execute the read-only tool calls of one assistant message concurrently.
+
+        Only calls that precede the first execute_action are prefetched, so each
+        result reflects the same game state the sequential loop would have seen.
+        Returns a map of tool_call.id -> result, or the exception the tool raised.
+        """
+        batch = []
+        for tool_call in tool_calls:
+            if tool_call.function.name == "execute_action":
+                break
+            tool = self.tools.get(tool_call.function.name)
+            if tool is not None:
+                batch.append((tool_call.id, tool, self._parse_tool_args(tool_call)))
+        if len(batch) < 2:
+            return {}
+
+        def run(tool: Any, args: Dict[str, Any]) -> Any:
+            try:
+                return tool.execute(**args)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=len(batch)) as pool:
+            futures = {call_id: pool.submit(run, tool, args) for call_id, tool, args in batch}
+            return {call_id: future.result() for call_id, future in futures.items()}
+
     def _reset_strategic_tool_tracking(self):
         """Reset the tracking for strategic tools at the start of each decision."""
-        self._strategic_tools_called = set()
+        self._strategic_mask = 0
+        self._cot_satisfied = False
     
     def _record_strategic_tool_call(self, tool_name: str):
         """Record that a strategic tool was called."""
-        strategic_tools = {
-            "evaluate_position",
-            "analyze_opponent", 
-            "recommend_strategy",
-            "can_i_win",
-            "analyze_threats"
-        }
-        if tool_name in strategic_tools:
-            self._strategic_tools_called.add(tool_name)
+        self._strategic_mask |= self._strategic_flags_by_tool.get(tool_name, 0)
+        if not self._cot_satisfied:
+            mask = self._strategic_mask
+            self._cot_satisfied = (
+                not _REQUIRED_STRATEGIC_TOOLS & ~mask
+                and mask.bit_count() >= self._min_strategic_tools
+            )
     
     def _validate_strategic_tools_called(self) -> tuple[bool, str]:
         """
         Validate that sufficient strategic tools were called before executing an action.
         Returns (is_valid, error_message).
         """
-        if not self._cot_enforcement_enabled:
+        if not self._cot_enforcement_enabled or self._cot_satisfied:
             return (True, "")
         
-        # Define required strategic tools (at least some subset must be called)
-        required_tools = {
-            "evaluate_position",  # Always need position awareness
-        }
-        
-        recommended_tools = {
-            "analyze_opponent",
-            "recommend_strategy",
-            "analyze_threats"
-        }
+        mask = self._strategic_mask
         
         # Check required tools
-        missing_required = required_tools - self._strategic_tools_called
+        missing_required = _REQUIRED_STRATEGIC_TOOLS & ~mask
         if missing_required:
-            return (False, f"Must call these strategic tools first: {', '.join(missing_required)}")
+            return (False, f"Must call these strategic tools first: {', '.join(_strategic_tool_names(missing_required))}")
         
         # Check minimum tool count
-        if len(self._strategic_tools_called) < self._min_strategic_tools:
-            missing_count = self._min_strategic_tools - len(self._strategic_tools_called)
-            return (False, f"Need at least {self._min_strategic_tools} strategic tool calls before acting. Called {len(self._strategic_tools_called)} so far. Consider: {', '.join(recommended_tools - self._strategic_tools_called)}")
+        called = mask.bit_count()
+        if called < self._min_strategic_tools:
+            return (False, f"Need at least {self._min_strategic_tools} strategic tool calls before acting. Called {called} so far. Consider: {', '.join(_strategic_tool_names(_RECOMMENDED_STRATEGIC_TOOLS & ~mask))}")
         
         return (True, "")
     
@@ -656,6 +849,14 @@ class MTGAgent:
 
         return action is not None
     
+    async def take_turn_action_async(self) -> bool:
+        """
+        Async variant of take_turn_action for drivers that run several games
+        in one event loop. The decision runs in a worker thread, so agents in
+        different games overlap their LLM round-trips.
+        """
+        return await asyncio.to_thread(self.take_turn_action)
+    
     def _make_simple_decision(self) -> Optional[Dict[str, Any]]:
         """
         Enhanced rule-based decision making that demonstrates agentic flow.
@@ -665,19 +866,19 @@ class MTGAgent:
             print("\n🔍 Analyzing game state...")
         
         # Step 1: Get game state (like LLM would)
-        game_state_tool = self.tools["get_game_state"]
+        game_state_tool = self._tool_set.get_game_state
         state_result = game_state_tool.execute()
         
         if not state_result.get("success"):
             return {"type": "pass", "reasoning": "Could not read game state"}
         
         # Step 2: Check stack state (instant-speed awareness)
-        stack_tool = self.tools["get_stack_state"]
+        stack_tool = self._tool_set.get_stack_state
         stack_result = stack_tool.execute()
         stack_empty = stack_result.get("is_empty", True)
         
         # Step 3: Analyze threats (strategic awareness)
-        threats_tool = self.tools["analyze_threats"]
+        threats_tool = self._tool_set.analyze_threats
         threats_result = threats_tool.execute()
         threats = threats_result.get("threats", [])
         
@@ -687,7 +888,7 @@ class MTGAgent:
         # Step 3.5: Evaluate overall position (Phase 1 tool)
         position_score = None
         try:
-            eval_tool = self.tools.get("evaluate_position")
+            eval_tool = self._tool_set.evaluate_position
             if eval_tool:
                 eval_result = eval_tool.execute()
                 self._position_eval = eval_result  # cache for visibility/debugging
@@ -709,7 +910,7 @@ class MTGAgent:
         # Step 3.7: Analyze opponent (Phase 2 tool - NEW)
         opponent_analysis = None
         try:
-            opponent_tool = self.tools.get("analyze_opponent")
+            opponent_tool = self._tool_set.analyze_opponent
             if opponent_tool:
                 opponent_result = opponent_tool.execute()
                 if opponent_result.get("success"):
@@ -731,7 +932,7 @@ class MTGAgent:
         # Step 3.9: Check for winning opportunities (Phase 2 tool - NEW)
         lethal_info = None
         try:
-            win_tool = self.tools.get("can_i_win")
+            win_tool = self._tool_set.can_i_win
             if win_tool:
                 win_result = win_tool.execute()
                 if win_result.get("success"):
@@ -751,7 +952,7 @@ class MTGAgent:
         # Step 4.1: Get strategy recommendation (Phase 2 tool - NEW)
         strategy_info = None
         try:
-            strategy_tool = self.tools.get("recommend_strategy")
+            strategy_tool = self._tool_set.recommend_strategy
             if strategy_tool:
                 strategy_result = strategy_tool.execute()
                 if strategy_result.get("success"):
@@ -772,7 +973,7 @@ class MTGAgent:
             strategy_info = None
         
     # Step 4: Get legal actions
-        legal_actions_tool = self.tools["get_legal_actions"]
+        legal_actions_tool = self._tool_set.get_legal_actions
         actions_result = legal_actions_tool.execute()
         
         if not actions_result.get("success"):
@@ -824,7 +1025,7 @@ class MTGAgent:
         else:
             # For non-interactive steps (untap, upkeep, draw, end step, cleanup, etc.)
             # Check if we can respond with instants
-            can_respond_tool = self.tools.get("can_respond")
+            can_respond_tool = self._tool_set.can_respond
             if can_respond_tool:
                 respond_result = can_respond_tool.execute()
                 
@@ -1275,7 +1476,7 @@ class MTGAgent:
     
     def _execute_action(self, action: Dict[str, Any]) -> Dict[str, Any]:
         """Execute an action using the tool."""
-        execute_tool = self.tools["execute_action"]
+        execute_tool = self._tool_set.execute_action
         
         # Execute with the action dict (matches ExecuteActionTool.execute signature)
         result = execute_tool.execute(action=action)
@@ -1290,8 +1491,8 @@ class MTGAgent:
     
     def analyze_position(self) -> Dict[str, Any]:
         """Analyze current position using tools."""
-        game_state_tool = self.tools["get_game_state"]
-        threats_tool = self.tools["analyze_threats"]
+        game_state_tool = self._tool_set.get_game_state
+        threats_tool = self._tool_set.analyze_threats
         
         game_state = game_state_tool.execute()
         threats = threats_tool.execute()
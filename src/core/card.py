@@ -1,6 +1,7 @@
 """
 Card representation for MTG.
 """
+from dataclasses import dataclass
 from enum import Enum
 from typing import Optional, List, TYPE_CHECKING, Any
 from pydantic import BaseModel, Field
@@ -123,8 +124,15 @@ class Card(BaseModel):
         return f"{self.name} {self.mana_cost} - {type_line}"
 
 
-class CardInstance(BaseModel):
-    """An instance of a card in a specific zone with game state."""
+@dataclass(slots=True, eq=False)
+class CardInstance:
+    """An instance of a card in a specific zone with game state.
+
+    A slotted dataclass rather than a pydantic model: games allocate many of
+    these and only ever build them from already-validated ``Card`` objects.
+    Equality and hashing are by identity, so zone membership checks are
+    pointer comparisons and instances can be kept in sets.
+    """
     card: Card
     instance_id: str  # Unique instance ID
     controller_id: str
@@ -144,7 +152,7 @@ class CardInstance(BaseModel):
     # Temporary modifications (cleared each turn)
     temp_power_bonus: int = 0
     temp_toughness_bonus: int = 0
-    summoning_sick: bool = True
+    summoning_sick: bool = False  # RulesEngine sets this when a creature enters the battlefield
 
     def current_power(self) -> int:
         """Calculate current power including modifications."""
@@ -3,7 +3,7 @@ Game state and turn structure for MTG.
 """
 from enum import Enum
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from core.player import Player
 from core.card import CardInstance
 
@@ -39,6 +39,53 @@ class Step(str, Enum):
     CLEANUP = "cleanup"
 
 
+# Turn history keeps at least this many of the most recent events. Older ones
+# are dropped in bulk once the list reaches twice this size.
+MAX_TURN_HISTORY_EVENTS = 4096
+
+
+def count_turn_event(actions: Dict[str, Dict[str, int]], event: Dict[str, Any]) -> None:
+    """Add one history event to per-player action counters used for pattern detection."""
+    player_id = event.get("player_id", "")
+    counts = actions.get(player_id)
+    if counts is None:
+        counts = actions[player_id] = {
+            "attacks": 0,
+            "spells_cast": 0,
+            "creatures_played": 0,
+            "removal_cast": 0,
+            "ramp_spells": 0,
+        }
+
+    event_type = event.get("event_type", "")
+    if event_type == "attack":
+        counts["attacks"] += 1
+    elif event_type == "spell_cast":
+        counts["spells_cast"] += 1
+        details = event.get("details", {})
+        if details.get("is_removal"):
+            counts["removal_cast"] += 1
+        if details.get("is_ramp"):
+            counts["ramp_spells"] += 1
+    elif event_type == "creature_played":
+        counts["creatures_played"] += 1
+
+
+def _index_turn_event(
+    events_by_turn: Dict[int, List[Dict[str, Any]]],
+    actions_by_turn: Dict[int, Dict[str, Dict[str, int]]],
+    event_types_by_turn: Dict[int, Dict[str, int]],
+    event: Dict[str, Any],
+) -> None:
+    """Add one history event to the per-turn event, action and event type indexes."""
+    turn = event["turn"]
+    events_by_turn.setdefault(turn, []).append(event)
+    count_turn_event(actions_by_turn.setdefault(turn, {}), event)
+    type_counts = event_types_by_turn.setdefault(turn, {})
+    event_type = event.get("event_type", "unknown")
+    type_counts[event_type] = type_counts.get(event_type, 0) + 1
+
+
 class GameState(BaseModel):
     """Represents the complete game state."""
     model_config = {"arbitrary_types_allowed": True}
@@ -63,12 +110,67 @@ class GameState(BaseModel):
     is_game_over: bool = False
     winner_id: Optional[str] = None
 
+    # id -> position in `players`, rebuilt when the list is swapped or a lookup
+    # lands on a slot that no longer holds that id
+    _player_index: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _indexed_players: Optional[List[Player]] = PrivateAttr(default=None)
+
+    # turn -> events, turn -> player -> action counts and turn -> event type counts
+    # over `turn_history`, rebuilt when the list is swapped or resized
+    _events_by_turn: Dict[int, List[Dict[str, Any]]] = PrivateAttr(default_factory=dict)
+    _actions_by_turn: Dict[int, Dict[str, Dict[str, int]]] = PrivateAttr(default_factory=dict)
+    _event_types_by_turn: Dict[int, Dict[str, int]] = PrivateAttr(default_factory=dict)
+    _indexed_history: Optional[List[Dict[str, Any]]] = PrivateAttr(default=None)
+    _indexed_event_count: int = PrivateAttr(default=0)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._reindex_players()
+        self._reindex_history()
+
+    def _reindex_players(self) -> None:
+        index: Dict[str, int] = {}
+        for position, player in enumerate(self.players):
+            index.setdefault(player.id, position)
+        self._player_index = index
+        self._indexed_players = self.players
+
+    def _reindex_history(self) -> None:
+        # Read-only tools can run on worker threads and reindex a stale history
+        # concurrently, so the new indexes are built in locals and only published
+        # once complete; a racing reindex just replaces them with an equal copy.
+        history = self.turn_history
+        events = list(history)
+        events_by_turn: Dict[int, List[Dict[str, Any]]] = {}
+        actions_by_turn: Dict[int, Dict[str, Dict[str, int]]] = {}
+        event_types_by_turn: Dict[int, Dict[str, int]] = {}
+        for event in events:
+            _index_turn_event(events_by_turn, actions_by_turn, event_types_by_turn, event)
+        self._events_by_turn = events_by_turn
+        self._actions_by_turn = actions_by_turn
+        self._event_types_by_turn = event_types_by_turn
+        self._indexed_history = history
+        self._indexed_event_count = len(events)
+
+    def _index_event(self, event: Dict[str, Any]) -> None:
+        _index_turn_event(self._events_by_turn, self._actions_by_turn, self._event_types_by_turn, event)
+
+    def _history_index_stale(self) -> bool:
+        return (
+            self._indexed_history is not self.turn_history
+            or self._indexed_event_count != len(self.turn_history)
+        )
+
     def get_player(self, player_id: str) -> Optional[Player]:
         """Get player by ID."""
-        for player in self.players:
-            if player.id == player_id:
-                return player
-        return None
+        players = self.players
+        position = self._player_index.get(player_id) if self._indexed_players is players else None
+        if position is None or position >= len(players) or players[position].id != player_id:
+            self._reindex_players()
+            position = self._player_index.get(player_id)
+            if position is None:
+                return None
+        # Reading through the list picks up a player replaced in place under the same id
+        return players[position]
 
     def get_active_player(self) -> Optional[Player]:
         """Get the active player."""
@@ -87,7 +189,9 @@ class GameState(BaseModel):
         return [p for p in self.players if not p.is_dead()]
 
     def check_win_condition(self):
-        """Check if the game is over."""
+        """Check if the game is over. A finished game stays finished."""
+        if self.is_game_over:
+            return
         alive_players = self.get_alive_players()
         if len(alive_players) == 1:
             self.is_game_over = True
@@ -113,15 +217,70 @@ class GameState(BaseModel):
             "player_name": player_name,
             "details": details,
         }
+        stale = self._history_index_stale()
         self.turn_history.append(event)  # type: ignore
+        if len(self.turn_history) > 2 * MAX_TURN_HISTORY_EVENTS:
+            del self.turn_history[:-MAX_TURN_HISTORY_EVENTS]
+            stale = True
+        if stale:
+            self._reindex_history()
+        else:
+            self._index_event(event)
+            self._indexed_event_count += 1
     
     def get_recent_history(self, last_n_turns: int = 5) -> List[Dict[str, Any]]:
         """
         Get recent turn history events.
         Phase 5a.3: Turn History & Memory
+
+        Returns every event from turn ``turn_number - last_n_turns`` on,
+        including any recorded for a later turn than ``turn_number``. Events
+        are grouped by turn in the order each turn first appears in
+        ``turn_history``, so for a history recorded in turn order this is
+        insertion order.
         """
+        if self._history_index_stale():
+            self._reindex_history()
+        min_turn = max(1, self.turn_number - last_n_turns)
+        recent: List[Dict[str, Any]] = []
+        for turn, events in self._events_by_turn.items():
+            if turn >= min_turn:
+                recent.extend(events)
+        return recent
+
+    def get_recent_action_counts(self, last_n_turns: int = 5) -> Dict[str, Dict[str, int]]:
+        """
+        Per-player action counts over the same window as get_recent_history,
+        summed from running per-turn counters rather than by re-scanning events.
+        """
+        if self._history_index_stale():
+            self._reindex_history()
+        min_turn = max(1, self.turn_number - last_n_turns)
+        totals: Dict[str, Dict[str, int]] = {}
+        for turn, turn_actions in self._actions_by_turn.items():
+            if turn < min_turn:
+                continue
+            for player_id, counts in turn_actions.items():
+                player_totals = totals.get(player_id)
+                if player_totals is None:
+                    totals[player_id] = dict(counts)
+                else:
+                    for key, value in counts.items():
+                        player_totals[key] += value
+        return totals
+
+    def get_recent_event_type_counts(self, last_n_turns: int = 5) -> Dict[str, int]:
+        """Event counts by type over the same window as get_recent_history."""
+        if self._history_index_stale():
+            self._reindex_history()
         min_turn = max(1, self.turn_number - last_n_turns)
-        return [event for event in self.turn_history if event["turn"] >= min_turn]
+        totals: Dict[str, int] = {}
+        for turn, type_counts in self._event_types_by_turn.items():
+            if turn < min_turn:
+                continue
+            for event_type, count in type_counts.items():
+                totals[event_type] = totals.get(event_type, 0) + count
+        return totals
 
     def get_next_player_id(self, current_player_id: str) -> str:
         """Get the next player in turn order."""
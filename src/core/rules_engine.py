@@ -2,6 +2,7 @@
 Core rules engine for MTG.
 Handles game logic, turn structure, and action validation.
 """
+from dataclasses import asdict
 from typing import Optional, List, Any
 import uuid
 from core.game_state import GameState, Phase, Step
@@ -11,6 +12,24 @@ from core.stack import Stack, StackObject, StackObjectType
 from core.triggers import TriggerQueue, QueuedTrigger, TriggerType
 
 
+# Steps of a turn in order, and each (phase, step)'s position in it
+_TURN_STEPS = (
+    (Phase.BEGINNING, Step.UNTAP),
+    (Phase.BEGINNING, Step.UPKEEP),
+    (Phase.BEGINNING, Step.DRAW),
+    (Phase.PRECOMBAT_MAIN, Step.MAIN),
+    (Phase.COMBAT, Step.BEGIN_COMBAT),
+    (Phase.COMBAT, Step.DECLARE_ATTACKERS),
+    (Phase.COMBAT, Step.DECLARE_BLOCKERS),
+    (Phase.COMBAT, Step.COMBAT_DAMAGE),
+    (Phase.COMBAT, Step.END_COMBAT),
+    (Phase.POSTCOMBAT_MAIN, Step.MAIN),
+    (Phase.ENDING, Step.END),
+    (Phase.ENDING, Step.CLEANUP),
+)
+_TURN_STEP_INDEX = {phase_step: i for i, phase_step in enumerate(_TURN_STEPS)}
+
+
 class RulesEngine:
     """Manages game rules and state transitions."""
     
@@ -20,6 +39,7 @@ class RulesEngine:
         self.trigger_queue = TriggerQueue()  # Create trigger queue
         self._pending_cards: dict = {}  # Store cards pending resolution
         self._pending_triggers: dict = {}  # Map stack object IDs to queued triggers
+        self._last_instance_serial = 0  # Suffix of the last create_card_instance id (plain int so the engine pickles)
         # Optional game logger (duck-typed to avoid hard dependency)
         self.game_logger: Optional[Any] = game_logger
         # Feature flags/config
@@ -64,49 +84,39 @@ class RulesEngine:
         for player in self.game_state.players:
             player.mana_pool.clear()
         
-        phase_order = [
-            (Phase.BEGINNING, Step.UNTAP),
-            (Phase.BEGINNING, Step.UPKEEP),
-            (Phase.BEGINNING, Step.DRAW),
-            (Phase.PRECOMBAT_MAIN, Step.MAIN),
-            (Phase.COMBAT, Step.BEGIN_COMBAT),
-            (Phase.COMBAT, Step.DECLARE_ATTACKERS),
-            (Phase.COMBAT, Step.DECLARE_BLOCKERS),
-            (Phase.COMBAT, Step.COMBAT_DAMAGE),
-            (Phase.COMBAT, Step.END_COMBAT),
-            (Phase.POSTCOMBAT_MAIN, Step.MAIN),
-            (Phase.ENDING, Step.END),
-            (Phase.ENDING, Step.CLEANUP),
-        ]
-        
         # Find current phase/step in order
         current = (self.game_state.current_phase, self.game_state.current_step)
-        try:
-            current_idx = phase_order.index(current)
-            next_idx = current_idx + 1
-            
-            if next_idx >= len(phase_order):
-                # End of turn: emit per-player summaries if enabled
-                if getattr(self, "turn_summary_enabled", False) and self.game_logger and hasattr(self.game_logger, "log_turn_summary"):
-                    for p in self.game_state.players:
-                        creatures_count = len(p.creatures_in_play())
-                        self.game_logger.log_turn_summary(
-                            self.game_state.turn_number,
-                            p.name,
-                            p.life,
-                            len(p.hand),
-                            creatures_count,
-                        )
-                # End of turn, move to next player
-                self.advance_turn()
-            else:
-                # Move to next phase/step
-                self.game_state.current_phase, self.game_state.current_step = phase_order[next_idx]
-                self.execute_phase_actions()
-        except ValueError:
+        current_idx = _TURN_STEP_INDEX.get(current)
+        if current_idx is None:
             # Invalid phase, reset to beginning
             self.game_state.current_phase = Phase.BEGINNING
             self.game_state.current_step = Step.UNTAP
+            return
+        
+        next_idx = current_idx + 1
+        if next_idx >= len(_TURN_STEPS):
+            # End of turn: emit per-player summaries if enabled
+            if getattr(self, "turn_summary_enabled", False) and self.game_logger and hasattr(self.game_logger, "log_turn_summary"):
+                for p in self.game_state.players:
+                    creatures_count = len(p.creatures_in_play())
+                    self.game_logger.log_turn_summary(
+                        self.game_state.turn_number,
+                        p.name,
+                        p.life,
+                        len(p.hand),
+                        creatures_count,
+                    )
+            # End of turn, move to next player
+            self.advance_turn()
+        else:
+            # Move to next phase/step
+            self.game_state.current_phase, self.game_state.current_step = _TURN_STEPS[next_idx]
+            self.execute_phase_actions()
+
+    def advance_phases(self, count: int):
+        """Advance count phases/steps, e.g. 12 to play out a whole turn."""
+        for _ in range(count):
+            self.advance_phase()
 
     def advance_turn(self):
         """Move to the next player's turn."""
@@ -340,7 +350,7 @@ class RulesEngine:
         self.stack.push(stack_obj)
         
         # Update game state stack representation
-        self.game_state.stack = [obj.model_dump() for obj in self.stack.get_all()]
+        self.game_state.stack = [asdict(obj) for obj in self.stack.get_all()]
         
         # Store card instance for resolution
         self._pending_cards[card_instance.instance_id] = card_instance
@@ -365,7 +375,7 @@ class RulesEngine:
             return False
         
         # Update game state
-        self.game_state.stack = [obj.model_dump() for obj in self.stack.get_all()]
+        self.game_state.stack = [asdict(obj) for obj in self.stack.get_all()]
         
         if stack_obj.object_type == StackObjectType.SPELL:
             # Resolve spell
@@ -467,6 +477,28 @@ class RulesEngine:
         
         return False
 
+    def resolve_stack_until_empty(self, max_resolutions: int = 64) -> int:
+        """
+        Pass priority around until the stack, including any triggers put on it
+        while resolving, is empty.
+
+        max_resolutions guards against a stack that never empties; going past
+        it raises RuntimeError rather than returning with objects left on the
+        stack. Returns the number of objects resolved.
+        """
+        resolved = 0
+        # Every player passing in turn resolves one object, so this only trips if passing stalls
+        passes_left = max_resolutions * max(1, len(self.game_state.players))
+        while not self.stack.is_empty():
+            if resolved >= max_resolutions or passes_left <= 0:
+                raise RuntimeError(
+                    f"Stack still has {self.stack.size()} objects after resolving {resolved}"
+                )
+            passes_left -= 1
+            if self.pass_priority():
+                resolved += 1
+        return resolved
+
     def declare_attackers(self, player: Player, attackers: List[tuple[CardInstance, str]]) -> bool:
         """Declare attacking creatures.
         
@@ -656,14 +688,33 @@ class RulesEngine:
         self.game_state.check_win_condition()
 
     def create_card_instance(self, card: Card, owner_id: str) -> CardInstance:
-        """Create a new instance of a card."""
+        """Create a new instance of a card.
+
+        Instance ids are ``f"{card.id}_{n}"`` with ``n`` counting up per engine,
+        which keeps them unique within the game and stable across runs.
+        """
+        self._last_instance_serial += 1
         return CardInstance(
             card=card,
-            instance_id=str(uuid.uuid4()),
+            instance_id=f"{card.id}_{self._last_instance_serial}",
             controller_id=owner_id,
             owner_id=owner_id
         )
 
+    def create_card_instances(self, card: Card, owner_id: str, count: int) -> List[CardInstance]:
+        """Create count instances of a card, e.g. to stock a library or battlefield."""
+        first = self._last_instance_serial + 1
+        self._last_instance_serial += count
+        return [
+            CardInstance(
+                card=card,
+                instance_id=f"{card.id}_{serial}",
+                controller_id=owner_id,
+                owner_id=owner_id
+            )
+            for serial in range(first, first + count)
+        ]
+
     # ===== Triggered Ability System =====
     
     def check_etb_triggers(self, permanent: CardInstance):
@@ -766,7 +817,7 @@ class RulesEngine:
         self.trigger_queue.clear()
         
         # Update game state stack representation
-        self.game_state.stack = [obj.model_dump() for obj in self.stack.get_all()]
+        self.game_state.stack = [asdict(obj) for obj in self.stack.get_all()]
         
         # Priority to active player
         self.stack.reset_priority_after_resolution(self.game_state.active_player_id)
@@ -2,9 +2,9 @@
 Stack implementation for MTG.
 Handles spell and ability resolution with priority passing.
 """
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any, Iterable
 from enum import Enum
-from pydantic import BaseModel, Field
 
 
 class StackObjectType(str, Enum):
@@ -13,8 +13,9 @@ class StackObjectType(str, Enum):
     ABILITY = "ability"
 
 
-class StackObject(BaseModel):
-    """Represents an object on the stack."""
+@dataclass(slots=True)
+class StackObject:
+    """Represents an object on the stack (slotted dataclass, like CardInstance)."""
     object_id: str
     object_type: StackObjectType
     controller_id: str
@@ -28,7 +29,7 @@ class StackObject(BaseModel):
     ability_text: Optional[str] = None
     
     # Targeting
-    targets: List[str] = Field(default_factory=list)
+    targets: List[str] = field(default_factory=list)
     
     # Metadata
     can_be_countered: bool = True
@@ -59,12 +60,22 @@ class Stack:
         """Get number of objects on stack."""
         return len(self.objects)
     
+    def __len__(self) -> int:
+        """Number of objects on stack (same as size())."""
+        return len(self.objects)
+    
     def push(self, stack_object: StackObject):
         """Add an object to the stack."""
         self.objects.append(stack_object)
         # Reset priority passes when something is added
         self.passes_in_succession = 0
     
+    def push_many(self, stack_objects: Iterable[StackObject]):
+        """Add several objects to the stack in order (last one ends up on top)."""
+        self.objects.extend(stack_objects)
+        # Reset priority passes once for the whole batch
+        self.passes_in_succession = 0
+    
     def pop(self) -> Optional[StackObject]:
         """Remove and return the top object from the stack."""
         if self.is_empty():
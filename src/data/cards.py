@@ -2,6 +2,7 @@
 Card database for Commander gameplay.
 Includes commonly played Commander staples across all categories.
 """
+from functools import lru_cache
 from typing import Optional
 from core.card import Card, CardType, ManaCost, Color
 from core.triggers import (
@@ -12,7 +13,19 @@ from core.triggers import (
 
 
 def create_basic_cards():
-    """Create a basic set of cards for testing."""
+    """
+    Create a basic set of cards for testing.
+
+    The returned dict is fresh, but its Card objects are shared with every
+    other caller: each card definition is built once per process and decks
+    hold references to it, with per-game state living on CardInstance.
+    """
+    return dict(_card_catalog())
+
+
+@lru_cache(maxsize=1)
+def _card_catalog():
+    """Build the card catalog keyed by card id (once; see create_basic_cards)."""
     cards = []
     
     # Basic Lands
@@ -24,7 +24,7 @@ from core.rules_engine import RulesEngine
 from core.card import Card, CardType, ManaCost, Color, CardInstance
 from agent.llm_agent import MTGAgent
 from data.cards import create_simple_deck
-from utils.logger import setup_loggers
+from utils.logger import LLM_LOG_VERBOSITY_LEVELS, setup_loggers
 
 
 def create_simple_commander():
@@ -130,7 +130,7 @@ def setup_game(num_players=4, verbose=True, archetypes=None):
     return game_state, rules_engine
 
 
-def play_game(game_state, rules_engine, max_full_turns=10, verbose=True, use_llm=True, aggression="balanced", llm_console_summary=False):
+def play_game(game_state, rules_engine, max_full_turns=10, verbose=True, use_llm=True, aggression="balanced", llm_console_summary=False, llm_log_verbosity="prompts_once"):
     """Play a game of Commander with simple auto-progression through phases.
 
     We progress the game by ensuring each loop iteration advances at least one
@@ -145,12 +145,17 @@ def play_game(game_state, rules_engine, max_full_turns=10, verbose=True, use_llm
         use_llm: Whether to use LLM for AI decisions (if False, uses rule-based heuristics)
         aggression: Combat aggression level
         llm_console_summary: If True, print one-line console summaries per LLM call
+        llm_log_verbosity: LLM log detail level ("full", "prompts_once", "decisions_only")
     """
 
     # Set up loggers
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     game_id = f"{timestamp}_{game_state.game_id[:8]}"
-    game_logger, llm_logger, heuristic_logger = setup_loggers(game_id, llm_console_summary=llm_console_summary)
+    game_logger, llm_logger, heuristic_logger = setup_loggers(
+        game_id,
+        llm_console_summary=llm_console_summary,
+        llm_log_verbosity=llm_log_verbosity,
+    )
     # Attach game logger to rules engine for internal events (draws, life changes)
     if hasattr(rules_engine, "set_game_logger"):
         rules_engine.set_game_logger(game_logger)
@@ -366,6 +371,15 @@ def main():
     llm_console_summary = False
     if "--llm-console" in sys.argv:
         llm_console_summary = True
+
+    # LLM log verbosity (default: log the system prompt once per player/model)
+    llm_log_verbosity = "prompts_once"
+    for arg in sys.argv:
+        if arg.startswith("--llm-log="):
+            llm_log_verbosity = arg.split("=")[1].lower()
+            if llm_log_verbosity not in LLM_LOG_VERBOSITY_LEVELS:
+                print(f"⚠️  Invalid LLM log level '{llm_log_verbosity}', using 'prompts_once'")
+                llm_log_verbosity = "prompts_once"
     
     # Show help if requested
     if "--help" in sys.argv or "-h" in sys.argv:
@@ -385,6 +399,10 @@ Options:
   --no-turn-summaries       Disable end-of-turn summaries in game log
   --turn-summaries          Enable end-of-turn summaries in game log (default)
   --llm-console             Print one-line console summaries per LLM call
+  --llm-log=LEVEL           LLM log detail (default: prompts_once)
+                            full: log every prompt message on every call
+                            prompts_once: log the system prompt only when it changes
+                            decisions_only: skip prompt bodies and tool results
   --help, -h                Show this help message
 
 Examples:
@@ -413,7 +431,8 @@ For more information, see README.md and QUICKSTART.md
         verbose=verbose,
         use_llm=not no_llm,
         aggression=aggression,
-        llm_console_summary=llm_console_summary
+        llm_console_summary=llm_console_summary,
+        llm_log_verbosity=llm_log_verbosity
     )
     
     print("\n✨ Thanks for playing! ✨\n")
@@ -5,6 +5,8 @@ Provides scoring functions to evaluate game state quality.
 """
 from typing import Dict, Any, Optional, List
 
+from core.game_state import count_turn_event
+
 
 class EvaluatePositionTool:
     """Evaluate the current position and return a score from 0.0 (losing badly) to 1.0 (winning)."""
@@ -50,7 +52,7 @@ class EvaluatePositionTool:
         
         # Get player to evaluate
         if player_id:
-            player = next((p for p in self.game_state.players if p.id == player_id), None)
+            player = self.game_state.get_player(player_id)
             if not player:
                 return {"error": f"Player {player_id} not found"}
         else:
@@ -367,7 +369,7 @@ class CanIWinTool:
         
         # Get player to evaluate
         if player_id:
-            player = next((p for p in self.game_state.players if p.id == player_id), None)
+            player = self.game_state.get_player(player_id)
             if not player:
                 return {"error": f"Player {player_id} not found"}
         else:
@@ -413,7 +415,7 @@ class CanIWinTool:
         
         # Generate considerations
         considerations = []
-        if not self._are_all_creatures_ready(player):
+        if not creature_damage["all_ready"]:
             considerations.append("Not all creatures are ready to attack (check summoning sickness)")
         
         if spell_damage["damage"] > 0:
@@ -447,15 +449,20 @@ class CanIWinTool:
         Calculate maximum damage from creatures that can attack.
         
         Returns:
-            dict with 'damage', 'count', and 'creatures' list
+            dict with 'damage', 'count', 'creatures' list, and 'all_ready'
+            (False if any creature is tapped or summoning sick)
         """
         total_damage = 0
         count = 0
         creatures = []
+        all_ready = True
         
-        for creature in player.creatures_in_play():
+        for creature in player.battlefield:
+            if not creature.card.is_creature():
+                continue
             # Check if creature can attack
             if not creature.can_attack():
+                all_ready = False
                 continue
             
             power = creature.current_power()
@@ -470,7 +477,8 @@ class CanIWinTool:
         return {
             "damage": total_damage,
             "count": count,
-            "creatures": creatures
+            "creatures": creatures,
+            "all_ready": all_ready
         }
     
     def _calculate_spell_damage(self, player: Any) -> Dict[str, Any]:
@@ -567,18 +575,6 @@ class CanIWinTool:
         
         return 0
     
-    def _are_all_creatures_ready(self, player: Any) -> bool:
-        """Check if all attacking creatures are ready (not summoning sick, not tapped)."""
-        creatures = player.creatures_in_play()
-        if not creatures:
-            # No creatures means nothing to be "not ready" for attacking
-            return True
-        # Return True only if all creatures are able to attack
-        for creature in creatures:
-            if not creature.can_attack():
-                return False
-        return True
-    
     def _generate_summary(self, lethal_target: Any, damage: int, line: str) -> str:
         """Generate human-readable summary."""
         if lethal_target:
@@ -639,7 +635,7 @@ class StrategyRecommendationTool:
         
         # Get player to evaluate
         if player_id:
-            player = next((p for p in self.game_state.players if p.id == player_id), None)
+            player = self.game_state.get_player(player_id)
             if not player:
                 return {"error": f"Player {player_id} not found"}
         else:
@@ -968,7 +964,7 @@ class OpponentModelingTool:
         
         # Get opponents to analyze
         if opponent_id:
-            opponent = next((p for p in self.game_state.players if p.id == opponent_id), None)
+            opponent = self.game_state.get_player(opponent_id)
             if not opponent:
                 return {"error": f"Opponent {opponent_id} not found"}
             opponents = [opponent]
@@ -1027,10 +1023,12 @@ class OpponentModelingTool:
         board_creatures = opponent.creatures_in_play()
         board_lands = opponent.lands_in_play()
         
-        # Categorize board creatures
-        aggro_creatures = self._count_aggro_creatures(board_creatures)
-        control_creatures = self._count_control_creatures(board_creatures)
-        combo_creatures = self._count_combo_creatures(board_creatures)
+        # Categorize board creatures (single pass)
+        profile = self._profile_creatures(board_creatures)
+        aggro_creatures = profile["aggro_creatures"]
+        control_creatures = profile["control_creatures"]
+        combo_creatures = profile["combo_creatures"]
+        total_power = profile["total_power"]
         ramp_artifacts = self._count_ramp_artifacts(opponent.battlefield)
         
         # Determine archetype
@@ -1044,21 +1042,17 @@ class OpponentModelingTool:
             len(opponent.hand)
         )
         
-        # Find biggest threat
-        biggest_threat = self._identify_biggest_threat(board_creatures)
+        biggest_threat = profile["biggest_threat"]
         
         # Calculate threat level
         threat_level = self._calculate_threat_level(
-            board_creatures,
+            total_power,
             opponent.life,
             active_player.life,
             aggro_creatures,
             len(opponent.hand)
         )
         
-        # Board summary
-        total_power = sum(c.current_power() for c in board_creatures if c.current_power() > 0)
-        
         # Estimate strategy from board
         estimated_strategy = self._estimate_strategy(archetype, len(board_creatures), total_power)
         
@@ -1089,35 +1083,65 @@ class OpponentModelingTool:
             "summary": self._generate_summary(opponent.name, archetype, threat_level, biggest_threat)
         }
     
-    def _count_aggro_creatures(self, creatures: List[Any]) -> int:
-        """Count creatures with power >= 3 or haste."""
-        count = 0
+    def _profile_creatures(self, creatures: List[Any]) -> Dict[str, Any]:
+        """
+        Categorize creatures and find the biggest threat in one pass.
+        
+        Aggro: power >= 3 or haste. Control: toughness >= 4, flying or reach.
+        Combo: oracle text mentioning tap/draw. Threat score: power +
+        toughness/2 plus evasion bonuses.
+        """
+        aggro = control = combo = total_power = 0
+        biggest = None
+        biggest_score = 0
+        biggest_stats = (0, 0)
+        
         for creature in creatures:
             power = creature.current_power()
-            has_haste = "haste" in creature.card.keywords
-            if power >= 3 or has_haste:
-                count += 1
-        return count
-    
-    def _count_control_creatures(self, creatures: List[Any]) -> int:
-        """Count creatures with defensive abilities or high toughness."""
-        count = 0
-        for creature in creatures:
             toughness = creature.current_toughness()
             keywords = creature.card.keywords
-            # Control creatures have flying, reach, or high toughness
+            oracle_text = creature.card.oracle_text
+            
+            if power > 0:
+                total_power += power
+            if power >= 3 or "haste" in keywords:
+                aggro += 1
             if toughness >= 4 or "flying" in keywords or "reach" in keywords:
-                count += 1
-        return count
-    
-    def _count_combo_creatures(self, creatures: List[Any]) -> int:
-        """Count creatures that might be part of combos."""
-        # Creatures with special abilities are combo pieces
-        count = 0
-        for creature in creatures:
-            if creature.card.oracle_text and ("tap" in creature.card.oracle_text.lower() or "draw" in creature.card.oracle_text.lower()):
-                count += 1
-        return count
+                control += 1
+            if oracle_text:
+                text = oracle_text.lower()
+                if "tap" in text or "draw" in text:
+                    combo += 1
+            
+            score = power + (toughness * 0.5)
+            # Bonus for evasion
+            if "flying" in keywords:
+                score += 3
+            if "unblockable" in keywords or "cant_be_blocked" in keywords:
+                score += 4
+            if "trample" in keywords:
+                score += 1
+            if score > biggest_score:
+                biggest_score = score
+                biggest = creature
+                biggest_stats = (power, toughness)
+        
+        biggest_threat = None
+        if biggest:
+            biggest_threat = {
+                "name": biggest.card.name,
+                "power": biggest_stats[0],
+                "toughness": biggest_stats[1],
+                "threat_score": biggest_score
+            }
+        
+        return {
+            "aggro_creatures": aggro,
+            "control_creatures": control,
+            "combo_creatures": combo,
+            "total_power": total_power,
+            "biggest_threat": biggest_threat
+        }
     
     def _count_ramp_artifacts(self, battlefield: List[Any]) -> int:
         """Count mana ramp artifacts."""
@@ -1181,45 +1205,9 @@ class OpponentModelingTool:
         
         return (archetype, confidence)
     
-    def _identify_biggest_threat(self, creatures: List[Any]) -> Optional[Dict[str, Any]]:
-        """Identify the most threatening creature on board."""
-        if not creatures:
-            return None
-        
-        biggest = None
-        biggest_score = 0
-        
-        for creature in creatures:
-            # Threat score: power + toughness + evasion bonus
-            power = creature.current_power()
-            toughness = creature.current_toughness()
-            score = power + (toughness * 0.5)
-            
-            # Bonus for evasion
-            if "flying" in creature.card.keywords:
-                score += 3
-            if "unblockable" in creature.card.keywords or "cant_be_blocked" in creature.card.keywords:
-                score += 4
-            if "trample" in creature.card.keywords:
-                score += 1
-            
-            if score > biggest_score:
-                biggest_score = score
-                biggest = creature
-        
-        if biggest:
-            return {
-                "name": biggest.card.name,
-                "power": biggest.current_power(),
-                "toughness": biggest.current_toughness(),
-                "threat_score": biggest_score
-            }
-        
-        return None
-    
     def _calculate_threat_level(
         self,
-        creatures: List[Any],
+        total_power: int,
         opponent_life: int,
         player_life: int,
         aggro_creatures: int,
@@ -1233,9 +1221,6 @@ class OpponentModelingTool:
         if opponent_life <= 0:
             return 0.0
         
-        # Power calculation
-        total_power = sum(c.current_power() for c in creatures if c.current_power() > 0)
-        
         # Base threat from power
         threat = min(1.0, total_power / 20.0)  # 20 power = max threat
         
@@ -1381,11 +1366,16 @@ class GetTurnHistoryTool:
         if event_filter:
             history = [e for e in history if e.get("event_type") == event_filter]
         
-        # Detect patterns
-        patterns = self._detect_patterns(history)
+        # Detect patterns (unfiltered windows read the game's running counters)
+        player_actions = None
+        event_types = None
+        if not player_filter and not event_filter:
+            player_actions = self.game_state.get_recent_action_counts(last_n_turns)
+            event_types = self.game_state.get_recent_event_type_counts(last_n_turns)
+        patterns = self._detect_patterns(history, player_actions)
         
         # Generate summary
-        summary = self._generate_summary(history, self.game_state.turn_number, last_n_turns)
+        summary = self._generate_summary(history, self.game_state.turn_number, last_n_turns, event_types)
         
         return {
             "success": True,
@@ -1399,8 +1389,17 @@ class GetTurnHistoryTool:
             "summary": summary
         }
     
-    def _detect_patterns(self, history: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Detect interesting patterns in turn history."""
+    def _detect_patterns(
+        self,
+        history: List[Dict[str, Any]],
+        player_actions: Optional[Dict[str, Dict[str, int]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Detect interesting patterns in turn history.
+        
+        player_actions may carry precomputed per-player counts for the same
+        events; otherwise they are tallied from history.
+        """
         patterns: Dict[str, Any] = {
             "aggressive_players": [],
             "controlling_players": [],
@@ -1408,34 +1407,10 @@ class GetTurnHistoryTool:
             "threats_removed": [],
         }
         
-        # Count actions by player
-        player_actions: Dict[str, Dict[str, int]] = {}
-        
-        for event in history:
-            player_id = event.get("player_id", "")
-            event_type = event.get("event_type", "")
-            
-            if player_id not in player_actions:
-                player_actions[player_id] = {
-                    "attacks": 0,
-                    "spells_cast": 0,
-                    "creatures_played": 0,
-                    "removal_cast": 0,
-                    "ramp_spells": 0,
-                }
-            
-            if event_type == "attack":
-                player_actions[player_id]["attacks"] += 1
-            elif event_type == "spell_cast":
-                player_actions[player_id]["spells_cast"] += 1
-                # Check for removal/ramp in details
-                details = event.get("details", {})
-                if details.get("is_removal"):
-                    player_actions[player_id]["removal_cast"] += 1
-                if details.get("is_ramp"):
-                    player_actions[player_id]["ramp_spells"] += 1
-            elif event_type == "creature_played":
-                player_actions[player_id]["creatures_played"] += 1
+        if player_actions is None:
+            player_actions = {}
+            for event in history:
+                count_turn_event(player_actions, event)
         
         # Identify patterns
         for player_id, actions in player_actions.items():
@@ -1472,8 +1447,14 @@ class GetTurnHistoryTool:
         player = self.game_state.get_player(player_id)
         return player.name if player else "Unknown"
     
-    def _generate_summary(self, history: List[Dict[str, Any]], current_turn: int, n_turns: int) -> str:
-        """Generate human-readable summary of recent events."""
+    def _generate_summary(
+        self,
+        history: List[Dict[str, Any]],
+        current_turn: int,
+        n_turns: int,
+        event_types: Optional[Dict[str, int]] = None,
+    ) -> str:
+        """Generate human-readable summary of recent events (event_types may be precomputed)."""
         if not history:
             return f"No events recorded in the last {n_turns} turns."
         
@@ -1481,10 +1462,11 @@ class GetTurnHistoryTool:
         event_count = len(history)
         
         # Count event types
-        event_types: Dict[str, int] = {}
-        for event in history:
-            event_type = event.get("event_type", "unknown")
-            event_types[event_type] = event_types.get(event_type, 0) + 1
+        if event_types is None:
+            event_types = {}
+            for event in history:
+                event_type = event.get("event_type", "unknown")
+                event_types[event_type] = event_types.get(event_type, 0) + 1
         
         # Build summary
         summary = f"📜 Last {n_turns} turns (Turn {min_turn}-{current_turn}): {event_count} events recorded. "
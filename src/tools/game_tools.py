@@ -785,3 +785,28 @@ class GetPendingTriggersTool(Tool):
             "you_have_priority": active_player and priority_player_id == active_player.id,
         }
 
+
+class GetFullContextTool(Tool):
+    """Bundle the read-only snapshot tools into a single call."""
+    sections: Dict[str, Any] = Field(default_factory=dict)  # result key -> tool, wired by the agent
+
+    def __init__(self, **data):
+        super().__init__(
+            name="get_full_context",
+            description=(
+                "Get the game state, stack, pending triggers, and threat analysis in one call. "
+                "Use this instead of calling get_game_state, get_stack_state, get_pending_triggers, "
+                "and analyze_threats separately."
+            ),
+            **data
+        )
+
+    def execute(self, **_kwargs) -> Dict[str, Any]:
+        """Run each section's tool and merge the results."""
+        if not self.sections:
+            return {"error": "Context tools not initialized"}
+
+        result: Dict[str, Any] = {"success": True}
+        for key, tool in self.sections.items():
+            result[key] = tool.execute()
+        return result
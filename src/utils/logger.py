@@ -6,10 +6,40 @@ Provides structured logging for:
 - LLM prompts and responses
 - Tool calls and results
 """
+import gzip
+import hashlib
 import json
 import logging
+import logging.handlers
+import os
+import shutil
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+# Optional: zstd compression for rotated LLM logs (falls back to gzip)
+try:
+    import zstandard  # type: ignore
+except Exception:
+    zstandard = None  # type: ignore
+
+
+LLM_LOG_VERBOSITY_LEVELS = ("full", "prompts_once", "decisions_only")
+
+
+def _compressed_log_namer(default_name: str) -> str:
+    """Name rotated LLM log files after the compression codec in use."""
+    return default_name + (".zst" if zstandard is not None else ".gz")
+
+
+def _compressing_log_rotator(source: str, dest: str) -> None:
+    """Compress a rotated log file into ``dest`` and remove the original."""
+    if zstandard is not None:
+        with open(source, "rb") as f_in, open(dest, "wb") as f_out:
+            zstandard.ZstdCompressor().copy_stream(f_in, f_out)
+    else:
+        with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
 
 
 class GameLogger:
@@ -133,18 +163,38 @@ class GameLogger:
 class LLMLogger:
     """Logger for LLM interactions and prompts."""
     
-    def __init__(self, log_dir: Path, game_id: str, console_summary: bool = False):
+    def __init__(
+        self,
+        log_dir: Path,
+        game_id: str,
+        console_summary: bool = False,
+        verbosity: str = "prompts_once",
+        max_bytes: int = 50 * 1024 * 1024,
+        backup_count: int = 5,
+    ):
         """Initialize LLM logger.
         
         Args:
             log_dir: Directory for log files
             game_id: Unique game identifier
             console_summary: If True, print a one-line summary per LLM call to console
+            verbosity: "full" logs every message of every call; "prompts_once" (default)
+                logs the system prompt only when it changes per (player, model);
+                "decisions_only" skips message bodies and tool results entirely
+            max_bytes: Rotate the log file once it exceeds this size (0 disables rotation)
+            backup_count: Number of compressed rotated files to keep
         """
+        if verbosity not in LLM_LOG_VERBOSITY_LEVELS:
+            raise ValueError(
+                f"Invalid LLM log verbosity '{verbosity}'. Expected one of: {', '.join(LLM_LOG_VERBOSITY_LEVELS)}"
+            )
         self.log_dir = log_dir
         self.game_id = game_id
         self.log_file = log_dir / f"llm_{game_id}.log"
         self.console_summary = console_summary
+        self.verbosity = verbosity
+        # Last-seen system prompt hash per (player, model), used by "prompts_once"
+        self._prompt_hashes: Dict[Tuple[str, str], str] = {}
         
         # Ensure log directory exists
         self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -156,14 +206,16 @@ class LLMLogger:
         # Clear any existing handlers
         self.logger.handlers.clear()
         
-        # File handler only (no console output)
-        fh = logging.FileHandler(self.log_file)
+        # File handler only (no console output); rotated files are compressed
+        fh = logging.handlers.RotatingFileHandler(self.log_file, maxBytes=max_bytes, backupCount=backup_count)
+        fh.namer = _compressed_log_namer
+        fh.rotator = _compressing_log_rotator
         fh.setLevel(logging.DEBUG)
         formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         fh.setFormatter(formatter)
         self.logger.addHandler(fh)
         
-        self.logger.info("LLM Logger initialized for game: %s", game_id)
+        self.logger.info("LLM Logger initialized for game: %s (verbosity: %s)", game_id, verbosity)
         
         # Track call count
         self.call_count = 0
@@ -188,13 +240,23 @@ class LLMLogger:
         self.logger.info("=" * 80)
         self.logger.info("LLM CALL #%d | %s | Turn %d | %s", self.call_count, player_name, turn, phase)
         self.logger.info("Model: %s", model)
+        if self.verbosity == "decisions_only":
+            return
         self.logger.info("-" * 80)
         
         # Log messages (full content, no truncation)
         self.logger.info("MESSAGES:")
         for i, msg in enumerate(messages):
             role = msg.get("role", "unknown")
-            content = msg.get("content", "")
+            content = msg.get("content") or ""
+            if i == 0 and role == "system" and self.verbosity == "prompts_once":
+                # Static system prompts are logged once per (player, model)
+                prompt_hash = hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
+                key = (player_name, model)
+                if self._prompt_hashes.get(key) == prompt_hash:
+                    self.logger.info("  [%d] SYSTEM: <same as previous, hash %s>", i, prompt_hash)
+                    continue
+                self._prompt_hashes[key] = prompt_hash
             # Log full content without truncation
             self.logger.info("  [%d] %s:", i, role.upper())
             for line in content.split('\n'):
@@ -277,6 +339,8 @@ class LLMLogger:
     def log_tool_execution(self, tool_name: str, args: Dict[str, Any], result: Dict[str, Any]):
         """Log tool execution with full results (no truncation)."""
         self.logger.info("TOOL EXEC | %s", tool_name)
+        if self.verbosity == "decisions_only":
+            return
         self.logger.debug("  Args: %s", json.dumps(args, indent=2))
         # Log full result without truncation
         result_json = json.dumps(result, indent=2)
@@ -401,7 +465,12 @@ class HeuristicLogger:
                 self.logger.info("       - %s", reason)
 
 
-def setup_loggers(game_id: str, log_base_dir: str = "logs", llm_console_summary: bool = False) -> tuple[GameLogger, LLMLogger, HeuristicLogger]:
+def setup_loggers(
+    game_id: str,
+    log_base_dir: str = "logs",
+    llm_console_summary: bool = False,
+    llm_log_verbosity: str = "prompts_once",
+) -> tuple[GameLogger, LLMLogger, HeuristicLogger]:
     """
     Set up game and LLM loggers for a game session.
     
@@ -409,6 +478,7 @@ def setup_loggers(game_id: str, log_base_dir: str = "logs", llm_console_summary:
         game_id: Unique game identifier
         log_base_dir: Base directory for logs (default: "logs")
         llm_console_summary: If True, print one-line console summaries per LLM call
+        llm_log_verbosity: LLM log detail ("full", "prompts_once", "decisions_only")
     
     Returns:
         Tuple of (GameLogger, LLMLogger, HeuristicLogger)
@@ -417,7 +487,7 @@ def setup_loggers(game_id: str, log_base_dir: str = "logs", llm_console_summary:
     log_dir.mkdir(parents=True, exist_ok=True)
     
     game_logger = GameLogger(log_dir, game_id)
-    llm_logger = LLMLogger(log_dir, game_id, console_summary=llm_console_summary)
+    llm_logger = LLMLogger(log_dir, game_id, console_summary=llm_console_summary, verbosity=llm_log_verbosity)
     heuristic_logger = HeuristicLogger(log_dir, game_id)
 
     return game_logger, llm_logger, heuristic_logger
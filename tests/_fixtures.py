@@ -0,0 +1,65 @@
+"""
+Shared builders for test battlefields.
+"""
+import itertools
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from core.card import Card, CardType, CardInstance, ManaCost, Color
+
+
+# Process-local ids are unique enough for tests and much cheaper than uuid4
+_IDS = itertools.count()
+
+
+def next_id(prefix: str = "id") -> str:
+    """Return a unique, deterministic test id such as ``card-3``."""
+    return f"{prefix}-{next(_IDS)}"
+
+
+# Creature cards are immutable templates, so one Card per distinct
+# (power, toughness, color, keywords) is shared by every instance built from it.
+_CARD_POOL: Dict[Tuple[int, int, Optional[Color], Tuple[str, ...]], Card] = {}
+
+
+def creature_card(
+    power: int,
+    toughness: int,
+    color: Optional[Color] = None,
+    keywords: Sequence[str] = (),
+) -> Card:
+    """Return the pooled creature card with the given stats."""
+    key = (power, toughness, color, tuple(keywords))
+    card = _CARD_POOL.get(key)
+    if card is None:
+        suffix = f"{power}_{toughness}_{color.value if color else 'C'}"
+        mana_cost = ManaCost(**{color.name.lower(): 1}) if color else ManaCost(generic=2)
+        card = Card(
+            id=f"creature_{suffix}" + "".join(f"_{k}" for k in key[3]),
+            name=f"Creature {power}/{toughness}",
+            mana_cost=mana_cost,
+            card_types=[CardType.CREATURE],
+            colors=[color] if color else [],
+            power=power,
+            toughness=toughness,
+            keywords=list(key[3]),
+        )
+        _CARD_POOL[key] = card
+    return card
+
+
+def make_creatures(owner_id: str, specs: Iterable[tuple], prefix: str = "creature") -> List[CardInstance]:
+    """
+    Build untapped, non-summoning-sick creatures for owner_id.
+
+    Each spec is (power, toughness[, color[, keywords]]); instance ids are
+    f"{prefix}_inst_{i}" in spec order.
+    """
+    return [
+        CardInstance(
+            card=creature_card(*spec),
+            instance_id=f"{prefix}_inst_{i}",
+            controller_id=owner_id,
+            owner_id=owner_id,
+        )
+        for i, spec in enumerate(specs)
+    ]
@@ -0,0 +1,50 @@
+"""
+Shared pytest configuration.
+
+``src`` is put on ``sys.path`` here, once per session, so test modules import
+``core``, ``agent`` and ``tools`` directly.
+
+The modules in ``_XDIST_GROUPED_MODULES`` each build their own game state and
+share nothing at module level, so they are pinned to one xdist worker per
+module. Run them in parallel with::
+
+    pytest -n auto --dist loadgroup tests
+
+Without pytest-xdist installed the mark is inert and tests run serially.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = str(Path(__file__).parent.parent / "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from data.cards import create_basic_cards
+
+_XDIST_GROUPED_MODULES = {
+    "test_phase2_integration",
+    "test_opponent_modeling_tool",
+    "test_llm_agent",
+}
+
+
+def pytest_configure(config):
+    # Registered here so the mark is known even when pytest-xdist is absent.
+    config.addinivalue_line(
+        "markers", "xdist_group(name): schedule tests with the same name on one xdist worker"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    for item in items:
+        module_name = item.module.__name__
+        if module_name.rsplit(".", 1)[-1] in _XDIST_GROUPED_MODULES:
+            item.add_marker(pytest.mark.xdist_group(name=module_name))
+
+
+@pytest.fixture(scope="session")
+def basic_cards():
+    """The card catalog keyed by card id, built once per session. Do not mutate."""
+    return create_basic_cards()
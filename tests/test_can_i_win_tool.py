@@ -1,11 +1,6 @@
 """
 Tests for the CanIWinTool - lethal damage detection.
 """
-import sys
-from pathlib import Path
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 import pytest
 import uuid
@@ -44,9 +39,7 @@ def game_with_creatures():
         card=creature1,
         instance_id="grizzly_1",
         controller_id="p1",
-        owner_id="p1",
-        is_tapped=False,
-        summoning_sick=False
+        owner_id="p1"
     )
     
     # 2/2 creature
@@ -63,9 +56,7 @@ def game_with_creatures():
         card=creature2,
         instance_id="elves_1",
         controller_id="p1",
-        owner_id="p1",
-        is_tapped=False,
-        summoning_sick=False
+        owner_id="p1"
     )
     
     # 5/5 creature (can deal lethal alone)
@@ -82,9 +73,7 @@ def game_with_creatures():
         card=creature3,
         instance_id="serra_1",
         controller_id="p1",
-        owner_id="p1",
-        is_tapped=False,
-        summoning_sick=False
+        owner_id="p1"
     )
     
     player1.battlefield.extend([creature1_inst, creature2_inst, creature3_inst])
@@ -238,7 +227,3 @@ def test_damage_extraction_patterns():
         oracle_text="target opponent loses 4 life"
     )
     assert tool._extract_damage_from_card(card) == 4
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
@@ -9,48 +9,137 @@ These tests validate Phase 4 functionality:
 - Stack tool functionality
 """
 
+import dataclasses
 import pytest
-import uuid
-import sys
-from pathlib import Path
+from functools import lru_cache
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
-
-from core.game_state import GameState
+from core.game_state import GameState, Phase, Step
 from core.player import Player
-from core.rules_engine import RulesEngine
 from core.card import Card, CardType, ManaCost, Color, CardInstance
 from core.stack import StackObject, StackObjectType
-from data.cards import create_basic_cards
-from tools.game_tools import GetStackStateTool, CanRespondTool, GetLegalActionsTool
+from core.rules_engine import RulesEngine
+from tools.game_tools import CanRespondTool, GetLegalActionsTool, GetStackStateTool
+from tests._fixtures import next_id
+
+
+@lru_cache(maxsize=1)
+def _get_land_cards():
+    """One basic land prototype per color, shared by every land instance."""
+    return {
+        color: Card(
+            id=name.lower(),
+            name=name,
+            card_types=[CardType.LAND],
+            colors=[color],
+            mana_cost=ManaCost()
+        )
+        for color, name in {
+            Color.BLUE: 'Island',
+            Color.GREEN: 'Forest',
+            Color.RED: 'Mountain',
+            Color.WHITE: 'Plains',
+            Color.BLACK: 'Swamp'
+        }.items()
+    }
+
+
+# Vanilla 2/2 used as the Giant Growth target; only its instance state varies
+_TEST_CREATURE_CARD = Card(
+    id='creature1',
+    name='Test Creature',
+    card_types=[CardType.CREATURE],
+    colors=[Color.GREEN],
+    mana_cost=ManaCost(green=1),
+    power=2,
+    toughness=2,
+    oracle_text=''
+)
+
+# Counterable opponent spell; tests copy it with per-test overrides
+_SPELL_TEMPLATE = StackObject(
+    object_id='',
+    object_type=StackObjectType.SPELL,
+    controller_id='p2',
+    card_name='',
+    can_be_countered=True
+)
+
+
+def make_spell(object_id, card_name, controller_id='p2'):
+    """Copy the spell template instead of running the full constructor.
+
+    replace() is a shallow copy, so each spell gets its own targets list.
+    """
+    return dataclasses.replace(
+        _SPELL_TEMPLATE, object_id=object_id, card_name=card_name, controller_id=controller_id,
+        targets=[]
+    )
 
 
-def create_test_game(num_players=2):
-    """Helper to create a basic test game."""
+def create_test_game(num_players=2, start=False):
+    """Helper to create a basic test game.
+
+    These tests work against an explicitly built stack, hand, and battlefield,
+    so ``start_game()`` (opening hands, turn flags) only runs when ``start=True``.
+    """
     players = [
         Player(id=f'p{i}', name=f'Player {i}', life=40)
         for i in range(1, num_players + 1)
     ]
     
     game_state = GameState(
-        game_id=str(uuid.uuid4()),
+        game_id=next_id('g'),
         players=players,
         active_player_id='p1',
         priority_player_id='p1'
     )
     
     rules_engine = RulesEngine(game_state)
-    rules_engine.start_game()
+    if start:
+        rules_engine.start_game()
     
     return game_state, rules_engine
 
 
+@pytest.fixture
+def game(request):
+    """Fresh (game_state, rules_engine) pair.
+
+    Defaults to 2 players; parametrize with ``indirect=True`` for other counts.
+    """
+    return create_test_game(num_players=getattr(request, 'param', 2))
+
+
+def _bind(tool, game_state, rules_engine):
+    """Attach game context to a tool and return it, ready for execute()."""
+    tool.game_state = game_state
+    tool.rules_engine = rules_engine
+    return tool
+
+
+@pytest.fixture
+def respond_tool():
+    """A CanRespondTool; tests attach game context with _bind()."""
+    return CanRespondTool()
+
+
+@pytest.fixture
+def stack_tool():
+    """A GetStackStateTool; tests attach game context with _bind()."""
+    return GetStackStateTool()
+
+
+@pytest.fixture
+def legal_actions_tool():
+    """A GetLegalActionsTool; tests attach game context with _bind()."""
+    return GetLegalActionsTool()
+
+
 def add_card_to_hand(player, card, controller_id):
     """Helper to add a card to player's hand."""
     instance = CardInstance(
         card=card,
-        instance_id=str(uuid.uuid4()),
+        instance_id=next_id('h'),
         controller_id=controller_id,
         owner_id=controller_id
     )
@@ -60,66 +149,62 @@ def add_card_to_hand(player, card, controller_id):
 
 def add_mana_to_battlefield(player, color, count, controller_id):
     """Helper to add mana sources (lands) to battlefield."""
-    color_map = {
-        Color.BLUE: 'Island',
-        Color.GREEN: 'Forest',
-        Color.RED: 'Mountain',
-        Color.WHITE: 'Plains',
-        Color.BLACK: 'Swamp'
-    }
+    land_card = _get_land_cards()[color]
     
-    land_card = Card(
-        id=f'{color_map[color].lower()}',
-        name=color_map[color],
-        card_types=[CardType.LAND],
-        colors=[color],
-        mana_cost=ManaCost()
-    )
-    
-    for _ in range(count):
-        instance = CardInstance(
+    # Lands enter untapped (the CardInstance default) so they are available for mana
+    player.battlefield.extend(
+        CardInstance(
             card=land_card,
-            instance_id=str(uuid.uuid4()),
+            instance_id=next_id('l'),
             controller_id=controller_id,
             owner_id=controller_id
         )
-        instance.is_tapped = False  # Lands available for mana
-        player.battlefield.append(instance)
+        for _ in range(count)
+    )
+
+
+def test_make_spell_copies_do_not_share_targets():
+    """Spells built from the template each get their own targets list."""
+    first = make_spell('spell1', 'Fireball')
+    second = make_spell('spell2', 'Lightning Bolt')
+    
+    first.targets.append('p1')
+    
+    assert second.targets == []
+    assert _SPELL_TEMPLATE.targets == []
 
 
 class TestInstantSpeedCasting:
     """Test basic instant-speed spell casting."""
     
-    def test_can_cast_instant_any_time(self):
+    def test_can_cast_instant_any_time(self, game, basic_cards, legal_actions_tool):
         """Test that instants can be cast when you have priority."""
-        game_state, rules_engine = create_test_game()
+        game_state, rules_engine = game
         player = game_state.players[0]
         
         # Give player Counterspell and mana
-        cards = create_basic_cards()
-        counterspell = cards['counterspell']
-        add_card_to_hand(player, counterspell, 'p1')
+        counterspell = add_card_to_hand(player, basic_cards['counterspell'], 'p1')
         add_mana_to_battlefield(player, Color.BLUE, 2, 'p1')
         
-        # Player should be able to cast instant using tool
-        tool = GetLegalActionsTool()
-        tool.game_state = game_state
-        tool.rules_engine = rules_engine
-        result = tool.execute()
+        # get_legal_actions offers spells in the main step
+        game_state.current_phase = Phase.PRECOMBAT_MAIN
+        game_state.current_step = Step.MAIN
+        result = _bind(legal_actions_tool, game_state, rules_engine).execute()
         
         # Check that counterspell is in castable spells
-        assert isinstance(result, list) or 'error' not in result
-        # Instant should be castable with sufficient mana
-        assert len(player.hand) > 0, "Should have card in hand"
+        assert result['success']
+        assert any(
+            a['type'] == 'cast_spell' and a['card_id'] == counterspell.instance_id
+            for a in result['actions']
+        ), "Counterspell should be castable with sufficient mana"
     
-    def test_instant_in_hand(self):
+    def test_instant_in_hand(self, game, basic_cards):
         """Test that instant spells are properly in hand."""
-        game_state, rules_engine = create_test_game()
+        game_state, rules_engine = game
         player = game_state.players[0]
         
         # Create an instant
-        cards = create_basic_cards()
-        lightning_bolt = cards['lightning_bolt']
+        lightning_bolt = basic_cards['lightning_bolt']
         add_card_to_hand(player, lightning_bolt, 'p1')
         add_mana_to_battlefield(player, Color.RED, 1, 'p1')
         
@@ -130,217 +215,94 @@ class TestInstantSpeedCasting:
         assert instant_in_hand.card.name == "Lightning Bolt"
 
 
+@pytest.fixture
+def counterspell_scene(game, basic_cards):
+    """Player 1 holds Counterspell with UU available while p2's Fireball is on the stack.
+
+    Returns (game_state, rules_engine, counter_instance) with p1 holding priority.
+    """
+    game_state, rules_engine = game
+    player1 = game_state.players[0]
+    counter_instance = add_card_to_hand(player1, basic_cards['counterspell'], 'p1')
+    add_mana_to_battlefield(player1, Color.BLUE, 2, 'p1')
+    
+    rules_engine.stack.push(make_spell('spell1', 'Fireball'))
+    rules_engine.stack.set_priority_order(['p1', 'p2'], 'p1')
+    game_state.priority_player_id = 'p1'
+    return game_state, rules_engine, counter_instance
+
+
 class TestCounterspells:
     """Test counterspell interactions."""
     
-    def test_counterspell_counters_spell(self):
+    def test_counterspell_counters_spell(self, counterspell_scene):
         """Test that Counterspell successfully counters a spell."""
-        game_state, rules_engine = create_test_game()
+        game_state, rules_engine, counter_instance = counterspell_scene
         player1 = game_state.players[0]
         
-        # Player 1 has Counterspell
-        cards = create_basic_cards()
-        counterspell = cards['counterspell']
-        counter_instance = add_card_to_hand(player1, counterspell, 'p1')
-        add_mana_to_battlefield(player1, Color.BLUE, 2, 'p1')
-        
-        # Player 2 casts a spell (simulate by adding to stack)
-        target_spell = StackObject(
-            object_id='spell1',
-            object_type=StackObjectType.SPELL,
-            controller_id='p2',
-            card_name='Fireball',
-            can_be_countered=True
-        )
-        rules_engine.stack.push(target_spell)
-        rules_engine.stack.set_priority_order(['p1', 'p2'], 'p1')
-        
-        # Player 1 should be able to cast Counterspell in response
-        game_state.priority_player_id = 'p1'
-        
         # Cast Counterspell
         result = rules_engine.cast_spell(player1, counter_instance)
         
         assert result == True, "Should successfully cast Counterspell"
-        assert rules_engine.stack.size() == 2, "Stack should have 2 spells"
+        assert len(rules_engine.stack) == 2, "Stack should have 2 spells"
         assert rules_engine.stack.peek().card_name == 'Counterspell'
-    
-    def test_stack_state_tool_with_counterspell(self):
-        """Test GetStackStateTool shows counterspell on stack."""
-        game_state, rules_engine = create_test_game()
-        
-        # Add two spells to stack
-        spell1 = StackObject(
-            object_id='spell1',
-            object_type=StackObjectType.SPELL,
-            controller_id='p2',
-            card_name='Fireball',
-            can_be_countered=True
-        )
-        spell2 = StackObject(
-            object_id='spell2',
-            object_type=StackObjectType.SPELL,
-            controller_id='p1',
-            card_name='Counterspell',
-            can_be_countered=True
-        )
-        
-        rules_engine.stack.push(spell1)
-        rules_engine.stack.push(spell2)
-        rules_engine.stack.set_priority_order(['p1', 'p2'], 'p1')
-        
-        # Test stack state tool
-        tool = GetStackStateTool()
-        tool.game_state = game_state
-        tool.rules_engine = rules_engine
-        
-        result = tool.execute()
-        
-        assert result['stack_size'] == 2
-        assert result['top_object']['name'] == 'Counterspell'
-        assert len(result['objects']) == 2
-        assert result['objects'][0]['name'] == 'Fireball'  # Bottom of stack
-        assert result['objects'][1]['name'] == 'Counterspell'  # Top of stack
 
 
 class TestCanRespondTool:
     """Test the CanRespondTool functionality."""
     
-    def test_can_respond_with_instants_in_hand(self):
+    @pytest.mark.parametrize(
+        'mana_count,priority_owner,expected_can,expected_castable',
+        [
+            (2, 'p1', True, 1),   # Instant in hand, mana, and priority
+            (0, 'p1', False, 0),  # No mana to cast instants
+            (2, 'p2', False, 1),  # Castable instant, but opponent has priority
+        ],
+        ids=['with_instants_in_hand', 'without_mana', 'without_priority'],
+    )
+    def test_can_respond(self, game, basic_cards, respond_tool, mana_count, priority_owner, expected_can, expected_castable):
         """Test tool correctly identifies when you can respond."""
-        game_state, rules_engine = create_test_game()
+        game_state, rules_engine = game
         player = game_state.players[0]
         
-        # Give player instants and mana
-        cards = create_basic_cards()
-        lightning_bolt = cards['lightning_bolt']
-        counterspell = cards['counterspell']
-        add_card_to_hand(player, lightning_bolt, 'p1')
+        # Give player an instant and (optionally) mana
+        counterspell = basic_cards['counterspell']
         add_card_to_hand(player, counterspell, 'p1')
-        add_mana_to_battlefield(player, Color.RED, 1, 'p1')
-        add_mana_to_battlefield(player, Color.BLUE, 2, 'p1')
+        add_mana_to_battlefield(player, Color.BLUE, mana_count, 'p1')
         
         # Add opponent spell to stack
-        spell = StackObject(
-            object_id='spell1',
-            object_type=StackObjectType.SPELL,
-            controller_id='p2',
-            card_name='Giant Growth',
-            can_be_countered=True
-        )
+        spell = make_spell('spell1', 'Fireball')
         rules_engine.stack.push(spell)
-        rules_engine.stack.set_priority_order(['p1', 'p2'], 'p1')
-        game_state.priority_player_id = 'p1'
+        rules_engine.stack.set_priority_order(['p1', 'p2'], priority_owner)
+        game_state.priority_player_id = priority_owner
         
         # Test can respond tool
-        tool = CanRespondTool()
-        tool.game_state = game_state
-        tool.rules_engine = rules_engine
-        
-        result = tool.execute()
+        result = _bind(respond_tool, game_state, rules_engine).execute()
         
-        assert result['has_priority'] == True
-        assert result['can_respond'] == True
-        assert len(result['castable_instants']) >= 1
-        assert result['top_of_stack']['name'] == 'Giant Growth'
-        assert 'recommendation' in result
+        assert result['has_priority'] == (priority_owner == 'p1')
+        assert result['can_respond'] == expected_can
+        assert len(result['castable_instants']) == expected_castable
+        assert result['top_of_stack']['name'] == 'Fireball'
         assert len(result['recommendation']) > 0
-    
-    def test_cannot_respond_without_mana(self):
-        """Test tool shows can't respond when no mana available."""
-        game_state, rules_engine = create_test_game()
-        player = game_state.players[0]
-        
-        # Give player instants but NO mana
-        cards = create_basic_cards()
-        counterspell = cards['counterspell']
-        add_card_to_hand(player, counterspell, 'p1')
-        
-        # Add opponent spell to stack
-        spell = StackObject(
-            object_id='spell1',
-            object_type=StackObjectType.SPELL,
-            controller_id='p2',
-            card_name='Fireball',
-            can_be_countered=True
-        )
-        rules_engine.stack.push(spell)
-        rules_engine.stack.set_priority_order(['p1', 'p2'], 'p1')
-        game_state.priority_player_id = 'p1'
-        
-        # Test can respond tool
-        tool = CanRespondTool()
-        tool.game_state = game_state
-        tool.rules_engine = rules_engine
-        
-        result = tool.execute()
-        
-        assert result['has_priority'] == True
-        assert result['can_respond'] == False  # No mana to cast instants
-        assert len(result['castable_instants']) == 0
-    
-    def test_cannot_respond_without_priority(self):
-        """Test tool shows can't respond when you don't have priority."""
-        game_state, rules_engine = create_test_game()
-        player = game_state.players[0]
-        
-        # Give player instants and mana
-        cards = create_basic_cards()
-        counterspell = cards['counterspell']
-        add_card_to_hand(player, counterspell, 'p1')
-        add_mana_to_battlefield(player, Color.BLUE, 2, 'p1')
-        
-        # Add spell to stack but give priority to opponent
-        spell = StackObject(
-            object_id='spell1',
-            object_type=StackObjectType.SPELL,
-            controller_id='p2',
-            card_name='Fireball',
-            can_be_countered=True
-        )
-        rules_engine.stack.push(spell)
-        rules_engine.stack.set_priority_order(['p1', 'p2'], 'p2')  # p2 has priority
-        game_state.priority_player_id = 'p2'
-        
-        # Test can respond tool
-        tool = CanRespondTool()
-        tool.game_state = game_state
-        tool.rules_engine = rules_engine
-        
-        result = tool.execute()
-        
-        assert result['has_priority'] == False
-        assert result['can_respond'] == False
 
 
 class TestCombatTricks:
     """Test instant-speed combat tricks."""
     
-    def test_giant_growth_in_combat(self):
+    def test_giant_growth_in_combat(self, game, basic_cards):
         """Test using Giant Growth as a combat trick."""
-        game_state, rules_engine = create_test_game()
+        game_state, rules_engine = game
         player = game_state.players[0]
         
         # Give player Giant Growth and mana
-        cards = create_basic_cards()
-        giant_growth = cards['giant_growth']
+        giant_growth = basic_cards['giant_growth']
         add_card_to_hand(player, giant_growth, 'p1')
         add_mana_to_battlefield(player, Color.GREEN, 1, 'p1')
         
         # Create a creature on battlefield
-        creature = Card(
-            id='creature1',
-            name='Test Creature',
-            card_types=[CardType.CREATURE],
-            colors=[Color.GREEN],
-            mana_cost=ManaCost(green=1),
-            power=2,
-            toughness=2,
-            oracle_text=''
-        )
         creature_instance = CardInstance(
-            card=creature,
-            instance_id=str(uuid.uuid4()),
+            card=_TEST_CREATURE_CARD,
+            instance_id=next_id('c'),
             controller_id='p1',
             owner_id='p1'
         )
@@ -354,18 +316,13 @@ class TestCombatTricks:
 class TestPriorityPassing:
     """Test priority passing mechanics."""
     
-    def test_priority_passes_around_table(self):
+    @pytest.mark.parametrize('game', [4], indirect=True)
+    def test_priority_passes_around_table(self, game):
         """Test that priority passes to each player in order."""
-        _, rules_engine = create_test_game(num_players=4)
+        _, rules_engine = game
         
         # Add a spell to stack
-        spell = StackObject(
-            object_id='spell1',
-            object_type=StackObjectType.SPELL,
-            controller_id='p1',
-            card_name='Rampant Growth',
-            can_be_countered=True
-        )
+        spell = make_spell('spell1', 'Rampant Growth', controller_id='p1')
         rules_engine.stack.push(spell)
         
         # Set priority order
@@ -376,22 +333,16 @@ class TestPriorityPassing:
         assert rules_engine.stack.priority_order == priority_order
         assert rules_engine.stack.get_priority_player() == 'p1'
     
-    def test_all_players_pass_resolves_stack(self):
+    def test_all_players_pass_resolves_stack(self, game):
         """Test that when all players pass, top of stack resolves."""
-        _, rules_engine = create_test_game(num_players=2)
+        _, rules_engine = game
         
         # Add spell to stack
-        spell = StackObject(
-            object_id='spell1',
-            object_type=StackObjectType.SPELL,
-            controller_id='p1',
-            card_name='Lightning Bolt',
-            can_be_countered=True
-        )
+        spell = make_spell('spell1', 'Lightning Bolt', controller_id='p1')
         rules_engine.stack.push(spell)
         rules_engine.stack.set_priority_order(['p1', 'p2'], 'p1')
         
-        initial_size = rules_engine.stack.size()
+        initial_size = len(rules_engine.stack)
         assert initial_size == 1, "Stack should have 1 spell"
         
         # Both players pass priority
@@ -406,79 +357,54 @@ class TestPriorityPassing:
 class TestStackTools:
     """Test stack-awareness tools integration."""
     
-    def test_get_stack_state_empty_stack(self):
-        """Test GetStackStateTool with empty stack."""
-        game_state, rules_engine = create_test_game()
-        
-        tool = GetStackStateTool()
-        tool.game_state = game_state
-        tool.rules_engine = rules_engine
-        
-        result = tool.execute()
-        
-        assert result['stack_size'] == 0
-        assert result['is_empty'] == True
-        assert len(result['objects']) == 0
-        assert result['top_object'] is None
-    
-    def test_get_stack_state_multiple_spells(self):
-        """Test GetStackStateTool with multiple spells."""
-        game_state, rules_engine = create_test_game()
-        
-        # Add 3 spells to stack
-        spells = ['Spell A', 'Spell B', 'Spell C']
-        for spell_name in spells:
-            spell = StackObject(
-                object_id=f'spell_{spell_name}',
-                object_type=StackObjectType.SPELL,
-                controller_id='p1',
-                card_name=spell_name,
-                can_be_countered=True
-            )
-            rules_engine.stack.push(spell)
-        
+    @pytest.mark.parametrize(
+        'spells',
+        [
+            [],
+            [('Spell A', 'p1'), ('Spell B', 'p1'), ('Spell C', 'p1')],
+            [('Fireball', 'p2'), ('Counterspell', 'p1')],
+        ],
+        ids=['empty_stack', 'multiple_spells', 'counterspell_on_top'],
+    )
+    def test_get_stack_state(self, game, stack_tool, spells):
+        """Test GetStackStateTool reports stack contents bottom to top."""
+        game_state, rules_engine = game
+        
+        # Push spells in order; the last one ends up on top
+        rules_engine.stack.push_many(
+            make_spell(f'spell_{name}', name, controller_id=controller)
+            for name, controller in spells
+        )
         rules_engine.stack.set_priority_order(['p1', 'p2'], 'p1')
         
-        tool = GetStackStateTool()
-        tool.game_state = game_state
-        tool.rules_engine = rules_engine
-        
-        result = tool.execute()
+        result = _bind(stack_tool, game_state, rules_engine).execute()
         
-        assert result['stack_size'] == 3
-        assert result['is_empty'] == False
-        assert result['top_object']['name'] == 'Spell C'  # Last one pushed
-        assert result['objects'][0]['name'] == 'Spell A'  # Bottom
-        assert result['objects'][2]['name'] == 'Spell C'  # Top
+        names = [name for name, _ in spells]
+        assert result['stack_size'] == len(spells)
+        assert result['is_empty'] == (not spells)
+        assert [obj['name'] for obj in result['objects']] == names  # Bottom to top
+        if spells:
+            assert result['top_object']['name'] == names[-1]  # Last one pushed
+        else:
+            assert result['top_object'] is None
     
-    def test_can_respond_recommendation_quality(self):
+    def test_can_respond_recommendation_quality(self, game, basic_cards, respond_tool):
         """Test that CanRespondTool provides useful recommendations."""
-        game_state, rules_engine = create_test_game()
+        game_state, rules_engine = game
         player = game_state.players[0]
         
         # Give player counterspell and mana
-        cards = create_basic_cards()
-        counterspell = cards['counterspell']
+        counterspell = basic_cards['counterspell']
         add_card_to_hand(player, counterspell, 'p1')
         add_mana_to_battlefield(player, Color.BLUE, 2, 'p1')
         
         # Add opponent spell to stack
-        spell = StackObject(
-            object_id='spell1',
-            object_type=StackObjectType.SPELL,
-            controller_id='p2',
-            card_name='Wrath of God',
-            can_be_countered=True
-        )
+        spell = make_spell('spell1', 'Wrath of God')
         rules_engine.stack.push(spell)
         rules_engine.stack.set_priority_order(['p1', 'p2'], 'p1')
         game_state.priority_player_id = 'p1'
         
-        tool = CanRespondTool()
-        tool.game_state = game_state
-        tool.rules_engine = rules_engine
-        
-        result = tool.execute()
+        result = _bind(respond_tool, game_state, rules_engine).execute()
         
         # Check recommendation contains useful info
         rec = result['recommendation']
@@ -488,7 +414,3 @@ class TestStackTools:
         # Should mention available options
         assert result['can_respond'] == True
         assert len(result['castable_instants']) > 0
-
-
-if __name__ == '__main__':
-    pytest.main([__file__, '-v'])
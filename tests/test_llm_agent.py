@@ -1,26 +1,24 @@
 """
 Tests for LLM agent integration.
 """
-import sys
-from pathlib import Path
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
+import asyncio
+import json
 import pytest
 import uuid
 import os
+import threading
+from types import MappingProxyType
 from unittest.mock import Mock, MagicMock, patch
 from core.game_state import GameState, Phase, Step
 from core.player import Player
 from core.card import Card, CardType, ManaCost, Color
 from core.rules_engine import RulesEngine
-from agent.llm_agent import MTGAgent
+from agent.llm_agent import MTGAgent, StrategicTool, _RequestRateLimiter
 
 
-@pytest.fixture
-def game_setup():
-    """Create a game setup for testing."""
+def _new_game():
+    """Build a fresh two-player game and rules engine."""
     player1 = Player(id="p1", name="Player 1", life=40)
     player2 = Player(id="p2", name="Player 2", life=40)
     
@@ -36,16 +34,28 @@ def game_setup():
     return game_state, rules_engine, player1, player2
 
 
-def test_agent_initialization_no_llm(game_setup):
-    """Test agent initializes correctly without LLM client."""
+@pytest.fixture
+def game_setup():
+    """Create a game setup for testing."""
+    return _new_game()
+
+
+@pytest.fixture
+def agent_fixture(game_setup):
+    """A heuristic agent on a fresh game, so no test sees another's state."""
     game_state, rules_engine, _, _ = game_setup
-    
     agent = MTGAgent(game_state, rules_engine, llm_client=None, verbose=False)
+    return agent, game_state, rules_engine
+
+
+def test_agent_initialization_no_llm(agent_fixture):
+    """Test agent initializes correctly without LLM client."""
+    agent, game_state, rules_engine = agent_fixture
     
     assert agent.game_state == game_state
     assert agent.rules_engine == rules_engine
-    # Should have 13 tools after Phase 5a.4
-    assert len(agent.tools) == 13
+    # Should have 14 tools after get_full_context
+    assert len(agent.tools) == 14
     assert "get_game_state" in agent.tools
     assert "get_legal_actions" in agent.tools
     assert "execute_action" in agent.tools
@@ -53,17 +63,16 @@ def test_agent_initialization_no_llm(game_setup):
     assert "get_stack_state" in agent.tools
     assert "can_respond" in agent.tools
     assert "get_pending_triggers" in agent.tools
+    assert "get_full_context" in agent.tools
     assert "evaluate_position" in agent.tools
     assert "can_i_win" in agent.tools
     assert "recommend_strategy" in agent.tools
     assert "analyze_opponent" in agent.tools
 
 
-def test_agent_tools_setup(game_setup):
+def test_agent_tools_setup(agent_fixture):
     """Test that agent tools are properly configured."""
-    game_state, rules_engine, _, _ = game_setup
-    
-    agent = MTGAgent(game_state, rules_engine, verbose=False)
+    agent, game_state, rules_engine = agent_fixture
     
     # Test get_game_state tool
     game_state_tool = agent.tools["get_game_state"]
@@ -83,9 +92,10 @@ def test_agent_tools_setup(game_setup):
     assert result["success"] is True
 
 
-def test_simple_decision_making(game_setup):
+def test_simple_decision_making(agent_fixture):
     """Test fallback heuristic decision making."""
-    game_state, rules_engine, player1, _ = game_setup
+    agent, game_state, rules_engine = agent_fixture
+    player1 = game_state.players[0]
     
     # Add a land to hand
     land = Card(id="forest", name="Forest", card_types=[CardType.LAND])
@@ -96,8 +106,6 @@ def test_simple_decision_making(game_setup):
     game_state.current_phase = Phase.PRECOMBAT_MAIN
     game_state.current_step = Step.MAIN
     
-    agent = MTGAgent(game_state, rules_engine, llm_client=None, verbose=False)
-    
     # Agent should decide to play land
     action = agent._make_simple_decision()
     
@@ -105,35 +113,45 @@ def test_simple_decision_making(game_setup):
     assert action["type"] == "play_land"
 
 
-def test_cot_enforcement_tracking(game_setup):
+def test_cot_enforcement_tracking(agent_fixture):
     """Test that strategic tools are tracked correctly."""
-    game_state, rules_engine, _, _ = game_setup
-    
-    agent = MTGAgent(game_state, rules_engine, llm_client=None, verbose=False)
+    agent, game_state, rules_engine = agent_fixture
     
     # Reset tracking
     agent._reset_strategic_tool_tracking()
-    assert len(agent._strategic_tools_called) == 0
+    assert agent._strategic_mask == 0
     
     # Record some tool calls
     agent._record_strategic_tool_call("evaluate_position")
-    assert "evaluate_position" in agent._strategic_tools_called
+    assert agent._strategic_mask & StrategicTool.EVALUATE_POSITION
     
     agent._record_strategic_tool_call("analyze_opponent")
-    assert "analyze_opponent" in agent._strategic_tools_called
+    assert agent._strategic_mask & StrategicTool.ANALYZE_OPPONENT
     
     # Non-strategic tools should not be tracked
     agent._record_strategic_tool_call("get_game_state")
-    assert "get_game_state" not in agent._strategic_tools_called
+    assert agent._strategic_mask == StrategicTool.EVALUATE_POSITION | StrategicTool.ANALYZE_OPPONENT
     
-    assert len(agent._strategic_tools_called) == 2
+    assert agent._strategic_mask.bit_count() == 2
 
 
-def test_cot_enforcement_validation_fails(game_setup):
-    """Test that validation fails when strategic tools not called."""
-    game_state, rules_engine, _, _ = game_setup
+def test_full_context_counts_as_bundled_strategic_tools(agent_fixture):
+    """Test that get_full_context records the strategic snapshots it includes."""
+    agent, game_state, rules_engine = agent_fixture
     
-    agent = MTGAgent(game_state, rules_engine, llm_client=None, verbose=False)
+    agent._record_strategic_tool_call("get_full_context")
+    
+    assert agent._strategic_mask == StrategicTool.ANALYZE_THREATS
+    
+    # With position and strategy it meets the default three-tool minimum
+    agent._record_strategic_tool_call("evaluate_position")
+    agent._record_strategic_tool_call("recommend_strategy")
+    assert agent._validate_strategic_tools_called() == (True, "")
+
+
+def test_cot_enforcement_validation_fails(agent_fixture):
+    """Test that validation fails when strategic tools not called."""
+    agent, game_state, rules_engine = agent_fixture
     agent._cot_enforcement_enabled = True
     agent._min_strategic_tools = 3
     
@@ -152,11 +170,9 @@ def test_cot_enforcement_validation_fails(game_setup):
     assert "at least 3" in error_msg
 
 
-def test_cot_enforcement_validation_passes(game_setup):
+def test_cot_enforcement_validation_passes(agent_fixture):
     """Test that validation passes when sufficient strategic tools called."""
-    game_state, rules_engine, _, _ = game_setup
-    
-    agent = MTGAgent(game_state, rules_engine, llm_client=None, verbose=False)
+    agent, game_state, rules_engine = agent_fixture
     agent._cot_enforcement_enabled = True
     agent._min_strategic_tools = 3
     
@@ -167,6 +183,7 @@ def test_cot_enforcement_validation_passes(game_setup):
     agent._record_strategic_tool_call("evaluate_position")
     agent._record_strategic_tool_call("analyze_opponent")
     agent._record_strategic_tool_call("recommend_strategy")
+    assert agent._strategic_mask.bit_count() == 3
     
     # Should pass now
     is_valid, error_msg = agent._validate_strategic_tools_called()
@@ -174,11 +191,78 @@ def test_cot_enforcement_validation_passes(game_setup):
     assert error_msg == ""
 
 
-def test_cot_enforcement_disabled(game_setup):
-    """Test that validation always passes when enforcement disabled."""
+def test_cot_enforcement_latches_until_reset(agent_fixture):
+    """Test that satisfied CoT requirements are cached for the rest of the decision."""
+    agent, game_state, rules_engine = agent_fixture
+    agent._cot_enforcement_enabled = True
+    agent._min_strategic_tools = 3
+
+    agent._reset_strategic_tool_tracking()
+    for name in ("evaluate_position", "analyze_opponent"):
+        agent._record_strategic_tool_call(name)
+    assert not agent._cot_satisfied
+
+    agent._record_strategic_tool_call("can_i_win")
+    assert agent._cot_satisfied
+    assert agent._validate_strategic_tools_called() == (True, "")
+
+    agent._reset_strategic_tool_tracking()
+    assert not agent._cot_satisfied
+    assert not agent._validate_strategic_tools_called()[0]
+
+
+def test_strategic_tool_calls_run_concurrently(game_setup):
+    """Test that independent tool calls in one message are dispatched in parallel."""
     game_state, rules_engine, _, _ = game_setup
-    
+
     agent = MTGAgent(game_state, rules_engine, llm_client=None, verbose=False)
+
+    names = ["evaluate_position", "analyze_opponent", "recommend_strategy"]
+    # Each call waits at the barrier for the others; run one at a time, it would time out
+    barrier = threading.Barrier(len(names))
+
+    def meet_then_return(name):
+        barrier.wait(timeout=5)
+        return {"tool": name}
+
+    slow_tools = {name: Mock(execute=lambda name=name: meet_then_return(name)) for name in names}
+    agent.tools = MappingProxyType({**agent.tools, **slow_tools})
+
+    tool_calls = []
+    for i, name in enumerate(names):
+        call = MagicMock(id=f"call_{i}")
+        call.function.name = name
+        call.function.arguments = ""
+        tool_calls.append(call)
+
+    results = agent._prefetch_read_only_tool_calls(tool_calls)
+
+    assert list(results) == ["call_0", "call_1", "call_2"]
+    assert [r["tool"] for r in results.values()] == names
+    assert not barrier.broken
+
+
+def test_prefetch_stops_at_execute_action(game_setup):
+    """Test that calls after execute_action are left for the sequential loop."""
+    game_state, rules_engine, _, _ = game_setup
+
+    agent = MTGAgent(game_state, rules_engine, llm_client=None, verbose=False)
+
+    tool_calls = []
+    for i, name in enumerate(["evaluate_position", "analyze_threats", "execute_action", "get_game_state"]):
+        call = MagicMock(id=f"call_{i}")
+        call.function.name = name
+        call.function.arguments = "{}"
+        tool_calls.append(call)
+
+    results = agent._prefetch_read_only_tool_calls(tool_calls)
+
+    assert list(results) == ["call_0", "call_1"]
+
+
+def test_cot_enforcement_disabled(agent_fixture):
+    """Test that validation always passes when enforcement disabled."""
+    agent, game_state, rules_engine = agent_fixture
     agent._cot_enforcement_enabled = False
     
     # Reset tracking
@@ -211,14 +295,16 @@ def test_llm_initialization_openrouter():
             assert "HTTP-Referer" in call_kwargs["default_headers"]
 
 
-def test_llm_tool_schemas(game_setup):
+def test_llm_tool_schemas(agent_fixture):
     """Test that tool schemas are properly formatted for LLM."""
-    game_state, rules_engine, _, _ = game_setup
-    
-    agent = MTGAgent(game_state, rules_engine, verbose=False)
+    agent, game_state, rules_engine = agent_fixture
     schemas = agent._get_tool_schemas()
     
-    assert len(schemas) == 13  # Updated: Phase 5a.4 adds recommend_combat_targets
+    assert len(schemas) == 14  # Updated: get_full_context bundles four snapshot tools
+    assert isinstance(schemas, tuple)
+    assert agent._get_tool_schemas() is schemas  # built once at import, shared by all agents
+    assert {s["function"]["name"] for s in schemas} == set(agent.tools)
+    assert all(agent._get_tool_schema(s["function"]["name"]) is s for s in schemas)
     
     # Check each schema has required fields
     for schema in schemas:
@@ -229,21 +315,19 @@ def test_llm_tool_schemas(game_setup):
         assert "parameters" in schema["function"]
     
     # Check execute_action has proper structure
-    execute_schema = next(s for s in schemas if s["function"]["name"] == "execute_action")
+    execute_schema = agent._get_tool_schema("execute_action")
     params = execute_schema["function"]["parameters"]
     assert "action" in params["properties"]
     assert "type" in params["properties"]["action"]["properties"]
 
     # Confirm evaluate_position schema exists
-    eval_schema = next(s for s in schemas if s["function"]["name"] == "evaluate_position")
+    eval_schema = agent._get_tool_schema("evaluate_position")
     assert eval_schema["function"]["parameters"]["type"] == "object"
 
 
-def test_tool_execution_with_error(game_setup):
+def test_tool_execution_with_error(agent_fixture):
     """Test that tool execution errors are handled gracefully."""
-    game_state, rules_engine, player1, _ = game_setup
-    
-    agent = MTGAgent(game_state, rules_engine, verbose=False)
+    agent, _, _ = agent_fixture
     
     # Try to execute invalid action
     result = agent.tools["execute_action"].execute(action={"type": "invalid_action"})
@@ -251,11 +335,9 @@ def test_tool_execution_with_error(game_setup):
     assert "error" in result or result.get("success") is False
 
 
-def test_agent_analyze_position(game_setup):
+def test_agent_analyze_position(agent_fixture):
     """Test position analysis method."""
-    game_state, rules_engine, _, _ = game_setup
-    
-    agent = MTGAgent(game_state, rules_engine, verbose=False)
+    agent, game_state, rules_engine = agent_fixture
     
     analysis = agent.analyze_position()
     
@@ -298,11 +380,53 @@ def test_llm_decision_with_mock(mock_openai_class, game_setup):
         assert "reasoning" in action
 
 
-def test_phase_specific_prompts(game_setup):
-    """Test that different phases get different prompts."""
+@patch('agent.llm_agent.OpenAI')
+def test_llm_decision_with_full_context(mock_openai_class, game_setup):
+    """Test that one get_full_context call returns every snapshot in a single round-trip."""
     game_state, rules_engine, _, _ = game_setup
     
-    agent = MTGAgent(game_state, rules_engine, verbose=False)
+    mock_client = MagicMock()
+    mock_openai_class.return_value = mock_client
+    
+    # First response requests the bundled context, second passes
+    context_call = MagicMock(id="call_ctx")
+    context_call.function.name = "get_full_context"
+    context_call.function.arguments = "{}"
+    context_response = MagicMock()
+    context_response.choices = [MagicMock()]
+    context_response.choices[0].message.content = ""
+    context_response.choices[0].message.tool_calls = [context_call]
+    context_response.usage = None
+    
+    pass_response = MagicMock()
+    pass_response.choices = [MagicMock()]
+    pass_response.choices[0].message.content = "Passing priority"
+    pass_response.choices[0].message.tool_calls = None
+    
+    mock_client.chat.completions.create.side_effect = [context_response, pass_response]
+    
+    with patch.dict(os.environ, {
+        "LLM_PROVIDER": "openrouter",
+        "OPENROUTER_API_KEY": "test-key"
+    }):
+        agent = MTGAgent(game_state, rules_engine, verbose=False)
+        agent.llm_client = mock_client
+        
+        action = agent._make_llm_decision()
+    
+    assert action["type"] == "pass"
+    assert mock_client.chat.completions.create.call_count == 2
+    
+    tool_messages = [m for m in agent.messages if m["role"] == "tool"]
+    assert len(tool_messages) == 1
+    context = json.loads(tool_messages[0]["content"])
+    assert context["success"] is True
+    assert {"game_state", "stack", "triggers", "threats"} <= context.keys()
+
+
+def test_phase_specific_prompts(agent_fixture):
+    """Test that different phases get different prompts."""
+    agent, game_state, rules_engine = agent_fixture
     
     # Test main phase prompt
     game_state.current_step = Step.MAIN
@@ -313,11 +437,13 @@ def test_phase_specific_prompts(game_setup):
     game_state.current_step = Step.DECLARE_ATTACKERS
     combat_prompt = agent._get_phase_specific_prompt()
     assert "attack" in combat_prompt.lower() or "declare_attackers" in combat_prompt.lower()
+    assert agent._get_phase_specific_prompt() is combat_prompt  # memoized per (phase, step, aggression)
 
 
-def test_agent_with_cards_in_hand(game_setup):
+def test_agent_with_cards_in_hand(agent_fixture):
     """Test agent behavior with cards in hand."""
-    game_state, rules_engine, player1, _ = game_setup
+    agent, game_state, rules_engine = agent_fixture
+    player1 = game_state.players[0]
     
     # Add various cards to hand
     forest = Card(id="forest", name="Forest", card_types=[CardType.LAND])
@@ -340,8 +466,6 @@ def test_agent_with_cards_in_hand(game_setup):
     game_state.current_phase = Phase.PRECOMBAT_MAIN
     game_state.current_step = Step.MAIN
     
-    agent = MTGAgent(game_state, rules_engine, verbose=False)
-    
     # Get legal actions
     legal_actions_tool = agent.tools["get_legal_actions"]
     result = legal_actions_tool.execute()
@@ -361,10 +485,12 @@ def test_fallback_to_heuristics_on_no_api_key(game_setup):
     
     with patch.dict(os.environ, {"LLM_PROVIDER": "openrouter"}, clear=True):
         # No OPENROUTER_API_KEY set
-        agent = MTGAgent(game_state, rules_engine, verbose=False)
+        with patch('agent.llm_agent._load_openai') as load_openai:
+            agent = MTGAgent(game_state, rules_engine, verbose=False)
         
-        # Should fall back to simple decision
+        # Should fall back to simple decision without importing the SDK
         assert agent.llm_client is None
+        load_openai.assert_not_called()
         
         # Add a land
         land = Card(id="forest", name="Forest", card_types=[CardType.LAND])
@@ -379,5 +505,64 @@ def test_fallback_to_heuristics_on_no_api_key(game_setup):
         assert action is not None
 
 
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+def test_rate_limiter_spaces_requests():
+    """Test that the shared limiter allows a burst, then paces requests."""
+    now = [0.0]
+    sleeps = []
+    
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+    
+    limiter = _RequestRateLimiter(2, clock=lambda: now[0], sleep=fake_sleep)  # 2/min
+    limiter.acquire()
+    limiter.acquire()
+    assert sleeps == []  # burst up to capacity
+    
+    limiter.acquire()
+    assert sleeps == [pytest.approx(30.0)]  # one token every 30s
+
+
+def test_malformed_rate_limit_setting_runs_unlimited(capsys):
+    """Test that an unparsable LLM_MAX_REQUESTS_PER_MINUTE doesn't stop the agent from starting."""
+    game_state, rules_engine, _, _ = _new_game()
+    
+    with patch.dict(os.environ, {"LLM_MAX_REQUESTS_PER_MINUTE": "60/min"}):
+        agent = MTGAgent(game_state, rules_engine, llm_client=None, verbose=False)
+    
+    assert agent._rate_limiter is None
+    assert "LLM_MAX_REQUESTS_PER_MINUTE" in capsys.readouterr().out
+
+
+def test_take_turn_action_async_overlaps_agents():
+    """Test that async turns for agents in separate games run concurrently."""
+    # Each decision waits at the barrier for the others; run one at a time, it would time out
+    barrier = threading.Barrier(3)
+    
+    def meet_then_pass():
+        barrier.wait(timeout=5)
+        return {"type": "pass"}
+    
+    agents = []
+    for _ in range(3):
+        game_state, rules_engine, _, _ = _new_game()
+        agent = MTGAgent(game_state, rules_engine, llm_client=None, verbose=False)
+        agent._make_llm_decision = meet_then_pass
+        agents.append(agent)
+    
+    async def play_all():
+        return await asyncio.gather(*(agent.take_turn_action_async() for agent in agents))
+    
+    results = asyncio.run(play_all())
+    
+    assert results == [True, True, True]
+    assert not barrier.broken
+
+
+def test_tools_mapping_is_read_only(agent_fixture):
+    """Test that the name -> tool view is backed by the agent's ToolSet."""
+    agent, _, _ = agent_fixture
+    
+    assert agent.tools["evaluate_position"] is agent._tool_set.evaluate_position
+    with pytest.raises(TypeError):
+        agent.tools["evaluate_position"] = None
@@ -0,0 +1,85 @@
+"""
+Tests for LLM log verbosity and rotation.
+"""
+import gzip
+
+import pytest
+from utils import logger as logger_module
+from utils.logger import LLMLogger
+
+
+MESSAGES = [
+    {"role": "system", "content": "You are a test AI\nPlay well."},
+    {"role": "user", "content": "What should I do?"},
+]
+
+
+def _log_two_calls(llm_logger):
+    for _ in range(2):
+        llm_logger.log_llm_call(
+            player_name="Player 1",
+            turn=1,
+            phase="precombat_main/main",
+            model="test-model",
+            messages=MESSAGES,
+        )
+    return llm_logger.log_file.read_text()
+
+
+def test_prompts_once_logs_system_prompt_once(tmp_path):
+    """The default verbosity logs a static system prompt only on the first call."""
+    text = _log_two_calls(LLMLogger(tmp_path, "prompts_once"))
+
+    assert text.count("You are a test AI") == 1
+    assert "SYSTEM: <same as previous, hash" in text
+    assert text.count("What should I do?") == 2
+
+
+def test_prompts_once_is_tracked_per_player(tmp_path):
+    """A different player sees the full system prompt on their first call."""
+    llm_logger = LLMLogger(tmp_path, "per_player")
+    for player_name in ("Player 1", "Player 2"):
+        llm_logger.log_llm_call(player_name, 1, "precombat_main/main", "test-model", MESSAGES)
+
+    assert llm_logger.log_file.read_text().count("You are a test AI") == 2
+
+
+def test_full_verbosity_logs_every_prompt(tmp_path):
+    """Full verbosity repeats the system prompt on every call."""
+    text = _log_two_calls(LLMLogger(tmp_path, "full", verbosity="full"))
+
+    assert text.count("You are a test AI") == 2
+    assert "same as previous" not in text
+
+
+def test_decisions_only_skips_messages_and_tool_results(tmp_path):
+    """Decisions-only verbosity keeps headers and decisions but no bodies."""
+    llm_logger = LLMLogger(tmp_path, "decisions_only", verbosity="decisions_only")
+    _log_two_calls(llm_logger)
+    llm_logger.log_tool_execution("get_game_state", {}, {"success": True, "secret": "board"})
+    llm_logger.log_decision("Player 1", {"type": "pass", "reasoning": "Nothing to do"})
+    text = llm_logger.log_file.read_text()
+
+    assert "LLM CALL #2" in text
+    assert "You are a test AI" not in text
+    assert "TOOL EXEC | get_game_state" in text
+    assert "secret" not in text
+    assert "Reasoning: Nothing to do" in text
+
+
+def test_invalid_verbosity_raises(tmp_path):
+    """Unknown verbosity levels are rejected."""
+    with pytest.raises(ValueError):
+        LLMLogger(tmp_path, "invalid", verbosity="everything")
+
+
+def test_rotated_logs_are_compressed(tmp_path, monkeypatch):
+    """Rotated LLM logs are compressed (gzip when zstandard is unavailable)."""
+    monkeypatch.setattr(logger_module, "zstandard", None)
+    llm_logger = LLMLogger(tmp_path, "rotate", verbosity="full", max_bytes=512, backup_count=2)
+    for _ in range(5):
+        _log_two_calls(llm_logger)
+
+    rotated = tmp_path / "llm_rotate.log.1.gz"
+    assert rotated.exists()
+    assert "LLM CALL" in gzip.decompress(rotated.read_bytes()).decode()
@@ -1,11 +1,6 @@
 """
 Tests for the OpponentModelingTool - opponent threat assessment and archetype detection.
 """
-import sys
-from pathlib import Path
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 import pytest
 import uuid
@@ -14,6 +9,7 @@ from core.player import Player
 from core.card import Card, CardType, CardInstance, ManaCost, Color
 from core.rules_engine import RulesEngine
 from tools.evaluation_tools import OpponentModelingTool
+from tests._fixtures import make_creatures
 
 
 @pytest.fixture
@@ -52,25 +48,7 @@ def test_aggro_archetype_detection(empty_game):
     player2 = game_state.players[1]
     
     # Add many small creatures to player2
-    for i in range(6):
-        card = Card(
-            id=f"goblin_{i}",
-            name=f"Goblin {i}",
-            mana_cost=ManaCost(red=1),
-            card_types=[CardType.CREATURE],
-            colors=[Color.RED],
-            power=2,
-            toughness=1
-        )
-        instance = CardInstance(
-            card=card,
-            instance_id=f"goblin_inst_{i}",
-            controller_id=player2.id,
-            owner_id=player2.id,
-            is_tapped=False,
-            summoning_sick=False
-        )
-        player2.battlefield.append(instance)
+    player2.battlefield.extend(make_creatures(player2.id, [(2, 1, Color.RED)] * 6, prefix="goblin"))
     
     result = tool.execute(opponent_id=player2.id)
     
@@ -102,9 +80,7 @@ def test_threat_assessment_high_threat(empty_game):
         card=dragon,
         instance_id="dragon_inst",
         controller_id=player2.id,
-        owner_id=player2.id,
-        is_tapped=False,
-        summoning_sick=False
+        owner_id=player2.id
     )
     player2.battlefield.append(instance)
     
@@ -138,9 +114,7 @@ def test_biggest_threat_identification(empty_game):
         card=weak,
         instance_id="goblin_inst",
         controller_id=player2.id,
-        owner_id=player2.id,
-        is_tapped=False,
-        summoning_sick=False
+        owner_id=player2.id
     )
     player2.battlefield.append(weak_inst)
     
@@ -158,9 +132,7 @@ def test_biggest_threat_identification(empty_game):
         card=strong,
         instance_id="titan_inst",
         controller_id=player2.id,
-        owner_id=player2.id,
-        is_tapped=False,
-        summoning_sick=False
+        owner_id=player2.id
     )
     player2.battlefield.append(strong_inst)
     
@@ -207,9 +179,7 @@ def test_confidence_scoring(empty_game):
         card=card,
         instance_id="creature_inst",
         controller_id=player2.id,
-        owner_id=player2.id,
-        is_tapped=False,
-        summoning_sick=False
+        owner_id=player2.id
     )
     player2.battlefield.append(inst)
     
@@ -228,26 +198,7 @@ def test_eliminate_political_priority(empty_game):
     player2 = game_state.players[1]
     
     # Add many threatening creatures
-    for i in range(4):
-        card = Card(
-            id=f"creature_{i}",
-            name=f"Creature {i}",
-            mana_cost=ManaCost(generic=i+1),
-            card_types=[CardType.CREATURE],
-            colors=[Color.RED],
-            power=4,
-            toughness=4,
-            keywords=["flying"]
-        )
-        inst = CardInstance(
-            card=card,
-            instance_id=f"creature_inst_{i}",
-            controller_id=player2.id,
-            owner_id=player2.id,
-            is_tapped=False,
-            summoning_sick=False
-        )
-        player2.battlefield.append(inst)
+    player2.battlefield.extend(make_creatures(player2.id, [(4, 4, Color.RED, ["flying"])] * 4))
     
     result = tool.execute(opponent_id=player2.id)
     
@@ -277,9 +228,7 @@ def test_hand_size_influences_threat(empty_game):
         card=card,
         instance_id="creature_inst",
         controller_id=player2.id,
-        owner_id=player2.id,
-        is_tapped=False,
-        summoning_sick=False
+        owner_id=player2.id
     )
     player2.battlefield.append(inst)
     
@@ -309,25 +258,7 @@ def test_strategy_estimate_wide_aggro(empty_game):
     player2 = game_state.players[1]
     
     # Add many small creatures (wide aggro)
-    for i in range(6):
-        card = Card(
-            id=f"goblin_{i}",
-            name=f"Goblin {i}",
-            mana_cost=ManaCost(red=1),
-            card_types=[CardType.CREATURE],
-            colors=[Color.RED],
-            power=1,
-            toughness=1
-        )
-        inst = CardInstance(
-            card=card,
-            instance_id=f"goblin_inst_{i}",
-            controller_id=player2.id,
-            owner_id=player2.id,
-            is_tapped=False,
-            summoning_sick=False
-        )
-        player2.battlefield.append(inst)
+    player2.battlefield.extend(make_creatures(player2.id, [(1, 1, Color.RED)] * 6, prefix="goblin"))
     
     result = tool.execute(opponent_id=player2.id)
     
@@ -3,19 +3,15 @@ Phase 2 Integration Tests - Regression Test Suite
 
 Tests multi-tool chains, tool interactions, and full gameplay scenarios.
 """
-import sys
-from pathlib import Path
+import asyncio
 import uuid
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
-
 from core.game_state import GameState
 from core.player import Player
-from core.card import Card, CardType, CardInstance, ManaCost, Color
 from core.rules_engine import RulesEngine
 from agent.llm_agent import MTGAgent
 from tools.evaluation_tools import CanIWinTool, StrategyRecommendationTool, OpponentModelingTool
+from tests._fixtures import make_creatures
 
 
 def create_game_state():
@@ -32,27 +28,6 @@ def create_game_state():
     return game_state
 
 
-def make_creature_instance(card_id: str, name: str, power: int, toughness: int, controller_id: str = "p1") -> CardInstance:
-    """Helper to create a ready-to-attack creature instance."""
-    card = Card(
-        id=card_id,
-        name=name,
-        mana_cost=ManaCost(),
-        card_types=[CardType.CREATURE],
-        power=power,
-        toughness=toughness,
-        colors=[]
-    )
-    return CardInstance(
-        card=card,
-        instance_id=f"{card_id}_inst",
-        controller_id=controller_id,
-        owner_id=controller_id,
-        is_tapped=False,
-        summoning_sick=False
-    )
-
-
 class TestHeuristicIntegration:
     """Test heuristic agent using all Phase 2 tools."""
     
@@ -69,8 +44,8 @@ class TestHeuristicIntegration:
             verbose=False
         )
         
-        # Verify all tools are available (updated: Phase 5a.4 adds combat intelligence)
-        assert len(agent.tools) == 13
+        # Verify all tools are available (updated: get_full_context bundles snapshots)
+        assert len(agent.tools) == 14
         assert "can_i_win" in agent.tools
         assert "recommend_strategy" in agent.tools
         assert "analyze_opponent" in agent.tools
@@ -89,9 +64,7 @@ class TestToolChains:
         player2.life = 10
         
         # Give Alice lethal creatures (ready to attack)
-        creature1 = make_creature_instance("dragon", "Dragon", power=6, toughness=6, controller_id="p1")
-        creature2 = make_creature_instance("knight", "Knight", power=4, toughness=2, controller_id="p1")
-        player1.battlefield.extend([creature1, creature2])
+        player1.battlefield.extend(make_creatures("p1", [(6, 6), (4, 2)]))
         
         # Create tools
         win_tool = CanIWinTool()
@@ -99,9 +72,14 @@ class TestToolChains:
         strategy_tool = StrategyRecommendationTool()
         strategy_tool.game_state = game_state
         
-        # Execute chain
-        win_result = win_tool.execute()
-        strategy_result = strategy_tool.execute(player_id="p1")
+        # Execute chain: both tools only read the game state, so run them together
+        async def run_chain():
+            return await asyncio.gather(
+                asyncio.to_thread(win_tool.execute),
+                asyncio.to_thread(strategy_tool.execute, player_id="p1"),
+            )
+
+        win_result, strategy_result = asyncio.run(run_chain())
         
         # Verify lethal detected
         assert win_result.get("success")
@@ -125,9 +103,7 @@ class TestToolAccuracy:
         player2.life = 15
         
         # Three 5/5 creatures = exactly 15 damage (ready to attack)
-        for i in range(3):
-            creature = make_creature_instance(card_id=f"creature{i}", name=f"Creature {i}", power=5, toughness=5, controller_id="p1")
-            player1.battlefield.append(creature)
+        player1.battlefield.extend(make_creatures("p1", [(5, 5)] * 3))
         
         win_tool = CanIWinTool()
         win_tool.game_state = game_state
@@ -144,9 +120,7 @@ class TestToolAccuracy:
         
         # Give opponent aggressive creatures (high power, low toughness)
         specs = [(3, 1), (3, 1), (2, 2), (4, 2)]
-        for i, (power, toughness) in enumerate(specs):
-            creature = make_creature_instance(card_id=f"creature{i}", name=f"Creature {i}", power=power, toughness=toughness, controller_id="p2")
-            player2.battlefield.append(creature)
+        player2.battlefield.extend(make_creatures("p2", specs))
         
         opp_tool = OpponentModelingTool()
         opp_tool.game_state = game_state
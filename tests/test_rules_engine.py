@@ -1,14 +1,12 @@
 """
 Tests for the rules engine.
 """
-import sys
-from pathlib import Path
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
+import dataclasses
+import pickle
 import pytest
 import uuid
+import warnings
 from core.game_state import GameState, Phase, Step
 from core.player import Player
 from core.card import Card, CardType, ManaCost
@@ -16,10 +14,14 @@ from core.rules_engine import RulesEngine
 
 
 @pytest.fixture
-def simple_game():
-    """Create a simple game for testing."""
-    player1 = Player(id="p1", name="Player 1", life=40)
-    player2 = Player(id="p2", name="Player 2", life=40)
+def simple_game(request):
+    """Create a simple game for testing.
+
+    Starting life defaults to 40; parametrize indirectly to change it.
+    """
+    life = getattr(request, "param", 40)
+    player1 = Player(id="p1", name="Player 1", life=life)
+    player2 = Player(id="p2", name="Player 2", life=life)
     
     game_state = GameState(
         game_id=str(uuid.uuid4()),
@@ -43,6 +45,75 @@ def test_game_initialization(simple_game):
     assert not game_state.is_game_over
 
 
+def test_card_instance_ids_are_unique_per_engine(simple_game):
+    """Test that instances of one card get distinct, deterministic ids."""
+    _, rules_engine = simple_game
+    land = Card(id="forest", name="Forest", card_types=[CardType.LAND])
+
+    first = rules_engine.create_card_instance(land, "p1")
+    second = rules_engine.create_card_instance(land, "p2")
+
+    assert first.card is second.card
+    assert (first.instance_id, second.instance_id) == ("forest_1", "forest_2")
+    assert second.controller_id == second.owner_id == "p2"
+
+
+def test_create_card_instances_in_bulk(simple_game):
+    """Test that bulk creation continues the engine's instance numbering."""
+    _, rules_engine = simple_game
+    land = Card(id="forest", name="Forest", card_types=[CardType.LAND])
+
+    first = rules_engine.create_card_instance(land, "p1")
+    batch = rules_engine.create_card_instances(land, "p1", 3)
+
+    assert [i.instance_id for i in batch] == ["forest_2", "forest_3", "forest_4"]
+    assert all(i.card is land and i.owner_id == "p1" for i in batch)
+    assert first not in batch
+    assert rules_engine.create_card_instances(land, "p1", 0) == []
+
+
+def test_instance_numbering_survives_pickling(simple_game):
+    """Test that a pickled engine keeps numbering where the original left off."""
+    _, rules_engine = simple_game
+    land = Card(id="forest", name="Forest", card_types=[CardType.LAND])
+    rules_engine.create_card_instance(land, "p1")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        clone = pickle.loads(pickle.dumps(rules_engine))
+
+    assert clone.create_card_instance(land, "p1").instance_id == "forest_2"
+    assert rules_engine.create_card_instance(land, "p1").instance_id == "forest_2"
+
+
+def test_card_instances_compare_by_identity(simple_game):
+    """Test that zone membership tracks the instance, not its field values."""
+    _, rules_engine = simple_game
+    land = Card(id="forest", name="Forest", card_types=[CardType.LAND])
+    instance = rules_engine.create_card_instance(land, "p1")
+    twin = dataclasses.replace(instance)
+
+    assert twin != instance
+    assert twin not in [instance]
+    assert {instance, twin, instance} == {instance, twin}
+
+
+def test_get_player_follows_players_replaced_in_place(simple_game):
+    """Test that get_player returns a player swapped into the list in place."""
+    game_state, _ = simple_game
+    assert game_state.get_player("p2").name == "Player 2"
+    
+    game_state.players[1] = Player(id="p2", name="Replacement", life=10)
+    assert game_state.get_player("p2") is game_state.players[1]
+    
+    game_state.players[1] = Player(id="p3", name="Newcomer", life=10)
+    assert game_state.get_player("p2") is None
+    assert game_state.get_player("p3") is game_state.players[1]
+    
+    game_state.players.reverse()
+    assert game_state.get_player("p1") is game_state.players[1]
+
+
 def test_land_drop(simple_game):
     """Test playing a land."""
     game_state, rules_engine = simple_game
@@ -98,17 +169,19 @@ def test_turn_advancement(simple_game):
     initial_player = game_state.active_player_id
     
     # Advance through all phases
-    for _ in range(12):  # 12 steps in a turn
-        rules_engine.advance_phase()
+    rules_engine.advance_phases(12)  # 12 steps in a turn
     
     # Should be next player's turn
     assert game_state.turn_number == initial_turn + 1
     assert game_state.active_player_id != initial_player
 
 
+@pytest.mark.parametrize("simple_game", [40, 20, 5], indirect=True, ids=lambda life: f"life-{life}")
 def test_win_condition(simple_game):
     """Test win condition detection."""
     game_state, _ = simple_game
+    game_state.check_win_condition()
+    assert not game_state.is_game_over
     
     # Kill player 2
     player2 = game_state.get_player("p2")
@@ -118,7 +191,3 @@ def test_win_condition(simple_game):
     
     assert game_state.is_game_over
     assert game_state.winner_id == "p1"
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
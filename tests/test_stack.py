@@ -1,27 +1,44 @@
 """
 Tests for Stack implementation and stack-based spell resolution.
 """
-import pytest
-import sys
-from pathlib import Path
+import random
+from collections import deque
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+import pytest
 
 from core.stack import Stack, StackObject, StackObjectType
 from core.game_state import GameState, Phase, Step
 from core.player import Player
 from core.card import Card, CardType, ManaCost, Color, CardInstance
 from core.rules_engine import RulesEngine
-import uuid
+from tests._fixtures import next_id
+
+
+# Mana costs are never mutated, so test cards share these
+_NO_COST = ManaCost()
+_GENERIC_2 = ManaCost(generic=2)
+
+# Forests are interchangeable, so every test land shares one Card
+_FOREST = Card(
+    id="forest",
+    name="Forest",
+    mana_cost=_NO_COST,
+    card_types=[CardType.LAND],
+    colors=[Color.GREEN]
+)
+
+
+def add_forests(rules_engine: RulesEngine, player: Player, count: int):
+    """Put count untapped Forests onto player's battlefield."""
+    player.battlefield.extend(rules_engine.create_card_instances(_FOREST, player.id, count))
 
 
 def create_test_card(name: str, is_creature: bool = True) -> Card:
     """Helper to create a test card."""
     return Card(
-        id=str(uuid.uuid4()),
+        id=next_id("card"),
         name=name,
-        mana_cost=ManaCost(generic=2),
+        mana_cost=_GENERIC_2,
         card_types=[CardType.CREATURE if is_creature else CardType.SORCERY],
         colors=[Color.GREEN],
         power=2 if is_creature else None,
@@ -41,7 +58,7 @@ def create_test_game(num_players: int = 2) -> tuple[GameState, RulesEngine]:
         players.append(player)
     
     game_state = GameState(
-        game_id=str(uuid.uuid4()),
+        game_id=next_id("game"),
         players=players,
         active_player_id="p1",
         priority_player_id="p1"
@@ -90,47 +107,26 @@ def test_stack_basic_operations():
     assert stack.peek() == obj1
 
 
-def test_stack_priority_order():
-    """Test priority passing system."""
-    stack = Stack()
-    player_ids = ["p1", "p2", "p3", "p4"]
-    
-    # Set priority order starting with p1
-    stack.set_priority_order(player_ids, "p1")
-    assert stack.get_priority_player() == "p1"
-    
-    # Pass priority
-    all_passed = stack.pass_priority()
-    assert not all_passed  # Not everyone has passed yet
-    assert stack.get_priority_player() == "p2"
-    
-    stack.pass_priority()
-    assert stack.get_priority_player() == "p3"
-    
-    stack.pass_priority()
-    assert stack.get_priority_player() == "p4"
+@pytest.mark.parametrize("num_players,start_idx", [(2, 0), (4, 0), (4, 2), (6, 3)])
+def test_stack_priority_order(num_players, start_idx):
+    """Test that priority starts with the active player and goes round once."""
+    game_state, _ = create_test_game(num_players)
+    player_ids = [p.id for p in game_state.players]
+    expected = deque(player_ids)
+    expected.rotate(-start_idx)
     
-    # Last player passes - all have passed
-    all_passed = stack.pass_priority()
-    assert all_passed  # Everyone passed
-
-
-def test_stack_priority_with_active_player():
-    """Test that priority starts with active player regardless of position."""
     stack = Stack()
-    player_ids = ["p1", "p2", "p3", "p4"]
+    stack.set_priority_order(player_ids, player_ids[start_idx])
     
-    # Active player is p3
-    stack.set_priority_order(player_ids, "p3")
+    seen = []
+    all_passed = False
+    for _ in player_ids:
+        assert not all_passed  # Not everyone has passed yet
+        seen.append(stack.get_priority_player())
+        all_passed = stack.pass_priority()
     
-    # Priority should start with p3, then go p4, p1, p2
-    assert stack.get_priority_player() == "p3"
-    stack.pass_priority()
-    assert stack.get_priority_player() == "p4"
-    stack.pass_priority()
-    assert stack.get_priority_player() == "p1"
-    stack.pass_priority()
-    assert stack.get_priority_player() == "p2"
+    assert seen == list(expected)
+    assert all_passed  # Last player passed - everyone has passed
 
 
 def test_cast_spell_puts_on_stack():
@@ -139,16 +135,7 @@ def test_cast_spell_puts_on_stack():
     player = game_state.players[0]
     
     # Give player mana and a card
-    for _ in range(3):
-        land_card = Card(
-            id=str(uuid.uuid4()),
-            name="Forest",
-            mana_cost=ManaCost(),
-            card_types=[CardType.LAND],
-            colors=[Color.GREEN]
-        )
-        land_instance = rules_engine.create_card_instance(land_card, player.id)
-        player.battlefield.append(land_instance)
+    add_forests(rules_engine, player, 3)
     
     creature_card = create_test_card("Bear")
     creature_instance = rules_engine.create_card_instance(creature_card, player.id)
@@ -178,16 +165,7 @@ def test_resolve_stack_creature():
     player = game_state.players[0]
     
     # Setup
-    for _ in range(3):
-        land_card = Card(
-            id=str(uuid.uuid4()),
-            name="Forest",
-            mana_cost=ManaCost(),
-            card_types=[CardType.LAND],
-            colors=[Color.GREEN]
-        )
-        land_instance = rules_engine.create_card_instance(land_card, player.id)
-        player.battlefield.append(land_instance)
+    add_forests(rules_engine, player, 3)
     
     creature_card = create_test_card("Bear")
     creature_instance = rules_engine.create_card_instance(creature_card, player.id)
@@ -216,16 +194,7 @@ def test_stack_lifo_resolution():
     player = game_state.players[0]
     
     # Setup mana
-    for _ in range(10):
-        land_card = Card(
-            id=str(uuid.uuid4()),
-            name="Forest",
-            mana_cost=ManaCost(),
-            card_types=[CardType.LAND],
-            colors=[Color.GREEN]
-        )
-        land_instance = rules_engine.create_card_instance(land_card, player.id)
-        player.battlefield.append(land_instance)
+    add_forests(rules_engine, player, 10)
     
     # Create two creatures
     creature1 = create_test_card("Bear 1")
@@ -254,6 +223,54 @@ def test_stack_lifo_resolution():
     assert rules_engine.stack.is_empty()
 
 
+def test_resolve_stack_until_empty():
+    """Test that passing priority around resolves every object on the stack."""
+    game_state, rules_engine = create_test_game()
+    player = game_state.players[0]
+    rules_engine.stack.set_priority_order([p.id for p in game_state.players], player.id)
+    
+    add_forests(rules_engine, player, 4)
+    bears = [rules_engine.create_card_instance(create_test_card(f"Bear {i}"), player.id) for i in range(2)]
+    player.hand.extend(bears)
+    for bear in bears:
+        assert rules_engine.cast_spell(player, bear)
+    
+    assert rules_engine.resolve_stack_until_empty() == 2
+    assert rules_engine.stack.is_empty()
+    assert all(bear in player.battlefield for bear in bears)
+    assert rules_engine.resolve_stack_until_empty() == 0
+
+
+def _cast_bears(num_players: int, num_bears: int):
+    """Put num_bears of player 1's bears on the stack in a num_players game."""
+    game_state, rules_engine = create_test_game(num_players)
+    player = game_state.players[0]
+    rules_engine.stack.set_priority_order([p.id for p in game_state.players], player.id)
+    add_forests(rules_engine, player, 2 * num_bears)
+    bears = [rules_engine.create_card_instance(create_test_card(f"Bear {i}"), player.id) for i in range(num_bears)]
+    player.hand.extend(bears)
+    for bear in bears:
+        assert rules_engine.cast_spell(player, bear)
+    return rules_engine, player, bears
+
+
+def test_resolve_stack_until_empty_multiplayer():
+    """Test that a deep stack empties in a four-player game."""
+    rules_engine, player, bears = _cast_bears(4, 20)
+    
+    assert rules_engine.resolve_stack_until_empty() == 20
+    assert rules_engine.stack.is_empty()
+    assert all(bear in player.battlefield for bear in bears)
+
+
+def test_resolve_stack_until_empty_raises_past_limit():
+    """Test that hitting the resolution limit is reported, not silently ignored."""
+    rules_engine, _, _ = _cast_bears(2, 3)
+    
+    with pytest.raises(RuntimeError, match="Stack still has 1 objects"):
+        rules_engine.resolve_stack_until_empty(max_resolutions=2)
+
+
 def test_pass_priority_with_empty_stack():
     """Test that passing priority with empty stack moves to next phase."""
     game_state, rules_engine = create_test_game(num_players=2)
@@ -300,6 +317,31 @@ def test_priority_resets_after_stack_addition():
     assert rules_engine.stack.passes_in_succession == 0
 
 
+def test_push_many_preserves_order_and_resets_priority():
+    """Test that push_many stacks objects in order and resets priority passes."""
+    stack = Stack()
+    stack.set_priority_order(["p1", "p2"], "p1")
+    stack.pass_priority()
+    assert stack.passes_in_succession == 1
+    
+    objs = [
+        StackObject(
+            object_id=f"obj{i}",
+            object_type=StackObjectType.SPELL,
+            controller_id="p1",
+            card_name=f"Spell {i}"
+        )
+        for i in range(3)
+    ]
+    stack.push_many(objs)
+    
+    assert stack.size() == 3
+    assert len(stack) == 3
+    assert stack.peek() == objs[-1]
+    assert stack.get_all() == objs
+    assert stack.passes_in_succession == 0
+
+
 def test_stack_to_dict():
     """Test stack serialization."""
     stack = Stack()
@@ -326,5 +368,30 @@ def test_stack_to_dict():
     assert result["objects"][0]["type"] == "spell"
 
 
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+@pytest.mark.parametrize("seed", range(20))
+def test_stack_random_push_pop_traces(seed):
+    """Test LIFO order and serialization against a list oracle on random traces."""
+    rng = random.Random(seed)
+    stack = Stack()
+    oracle = []
+    
+    for step in range(rng.randint(1, 40)):
+        if oracle and rng.random() < 0.4:
+            assert stack.pop() is oracle.pop()
+        else:
+            obj = StackObject(
+                object_id=f"obj{step}",
+                object_type=StackObjectType.SPELL,
+                controller_id=rng.choice(["p1", "p2"]),
+                card_name=f"Spell {step}"
+            )
+            stack.push(obj)
+            oracle.append(obj)
+        
+        assert stack.size() == len(oracle)
+        assert stack.is_empty() == (not oracle)
+        assert stack.peek() is (oracle[-1] if oracle else None)
+        
+        result = stack.to_dict()
+        assert result["size"] == len(oracle)
+        assert [o["object_id"] for o in result["objects"]] == [o.object_id for o in oracle]
@@ -2,12 +2,10 @@
 Tests for Phase 5a.3: Turn History & Memory
 """
 import sys
-from pathlib import Path
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+import threading
 
 import pytest
+import core.game_state as game_state_module
 from core.game_state import GameState, Phase, Step
 from core.player import Player
 from core.card import Card, CardType, Color, ManaCost, CardInstance
@@ -93,6 +91,82 @@ def test_get_recent_history(game_state):
     assert recent[1]["turn"] == 10
 
 
+def test_get_recent_history_after_history_replaced(game_state):
+    """The turn index follows a turn_history list that was assigned directly."""
+    game_state.record_turn_event("land_played", "p1", {"card_name": "Forest"})
+    game_state.turn_history = [
+        {"turn": 3, "event_type": "attack", "player_id": "p2", "details": {}},
+        {"turn": 4, "event_type": "spell_cast", "player_id": "p1", "details": {}},
+    ]
+    game_state.turn_number = 4
+    game_state.record_turn_event("land_played", "p1", {"card_name": "Forest"})
+
+    recent = game_state.get_recent_history(last_n_turns=1)
+
+    assert [e["event_type"] for e in recent] == ["attack", "spell_cast", "land_played"]
+
+
+def test_get_recent_history_keeps_later_turns(game_state):
+    """Events past turn_number stay in the window; events are grouped by turn in first-seen order."""
+    game_state.turn_history = [
+        {"turn": 2, "event_type": "land_played", "player_id": "p1", "details": {}},
+        {"turn": 7, "event_type": "attack", "player_id": "p2", "details": {}},
+        {"turn": 3, "event_type": "spell_cast", "player_id": "p1", "details": {}},
+        {"turn": 7, "event_type": "spell_cast", "player_id": "p2", "details": {}},
+    ]
+    game_state.turn_number = 4
+
+    recent = game_state.get_recent_history(last_n_turns=1)
+
+    assert [(e["turn"], e["event_type"]) for e in recent] == [(7, "attack"), (7, "spell_cast"), (3, "spell_cast")]
+    assert game_state.get_recent_event_type_counts(last_n_turns=1) == {"attack": 1, "spell_cast": 2}
+    assert game_state.get_recent_action_counts(last_n_turns=1)["p2"]["attacks"] == 1
+
+
+def test_concurrent_reindex_of_replaced_history(game_state):
+    """Threads reindexing a directly assigned history at once each count every event once."""
+    thread_count = 8
+    events_per_turn = 500
+    barrier = threading.Barrier(thread_count)
+    results = []
+
+    def read_counts():
+        barrier.wait(timeout=5)
+        results.append(game_state.get_recent_event_type_counts(last_n_turns=1))
+
+    # Switch threads as often as possible so the reindexes interleave
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(20):
+            game_state.turn_history = [
+                {"turn": 1, "event_type": "attack", "player_id": "p1", "details": {}}
+                for _ in range(events_per_turn)
+            ]
+            threads = [threading.Thread(target=read_counts) for _ in range(thread_count)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert results == [{"attack": events_per_turn}] * (20 * thread_count)
+
+
+def test_turn_history_is_capped(game_state, monkeypatch):
+    """Old events are dropped once the history grows past the cap."""
+    monkeypatch.setattr(game_state_module, "MAX_TURN_HISTORY_EVENTS", 4)
+
+    for turn in range(1, 11):
+        game_state.turn_number = turn
+        game_state.record_turn_event("attack", "p1", {"attacker_count": 1})
+
+    assert [e["turn"] for e in game_state.turn_history] == [6, 7, 8, 9, 10]
+    assert [e["turn"] for e in game_state.get_recent_history(last_n_turns=9)] == [6, 7, 8, 9, 10]
+    assert game_state.get_recent_action_counts(9)["p1"]["attacks"] == 5
+
+
 def test_turn_history_tool(game_state):
     """Test the GetTurnHistoryTool."""
     tool = GetTurnHistoryTool()
@@ -184,6 +258,28 @@ def test_pattern_detection_ramp(game_state):
     assert result["patterns"]["ramping_players"][0]["ramp_count"] == 2
 
 
+def test_pattern_counters_match_window_scan(game_state):
+    """Running per-turn counters agree with re-tallying the recent window."""
+    tool = GetTurnHistoryTool()
+    tool.game_state = game_state
+
+    for turn in range(1, 9):
+        game_state.turn_number = turn
+        game_state.record_turn_event("attack", "p2", {"attacker_count": 1})
+        game_state.record_turn_event("spell_cast", "p1", {"is_removal": turn % 2 == 0, "is_ramp": turn < 4})
+        game_state.record_turn_event("land_played", "p1", {"card_name": "Forest"})
+
+    history = game_state.get_recent_history(last_n_turns=3)
+    from_counters = tool._detect_patterns(history, game_state.get_recent_action_counts(3))
+
+    assert from_counters == tool._detect_patterns(history)
+    assert tool._generate_summary(history, 8, 3, game_state.get_recent_event_type_counts(3)) == \
+        tool._generate_summary(history, 8, 3)
+    assert from_counters["aggressive_players"][0]["attack_count"] == 4
+    assert from_counters["controlling_players"][0]["removal_count"] == 2
+    assert from_counters["ramping_players"] == []
+
+
 def test_rules_engine_records_land_play(game_state, rules_engine):
     """Test that rules engine records land plays."""
     player = game_state.get_player("p1")
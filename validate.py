@@ -3,6 +3,7 @@
 Validation script to check MTG AI implementation status.
 Run this to verify everything is working correctly.
 """
+import importlib.util
 import sys
 import os
 from pathlib import Path
@@ -72,15 +73,12 @@ def check_dependencies():
         "pytest": "Testing"
     }
     
+    # Only locate each package; importing openai and friends is slow and not needed here
     all_installed = True
     for package, description in required.items():
-        try:
-            if package == "dotenv":
-                __import__("dotenv")
-            else:
-                __import__(package)
+        if importlib.util.find_spec(package) is not None:
             print(f"  ✅ {package:15} - {description}")
-        except ImportError:
+        else:
             print(f"  ❌ {package:15} - {description} (not installed)")
             all_installed = False
     
@@ -90,17 +88,22 @@ def check_dependencies():
 def check_tests():
     """Check if tests can run."""
     print("\n🔍 Checking tests...")
-    import subprocess
+    import contextlib
+    import io
+    try:
+        import pytest
+    except ImportError:
+        print("  ❌ pytest not installed")
+        return False
     
-    result = subprocess.run(
-        ["python", "-m", "pytest", "tests/", "-v", "--co"],
-        capture_output=True,
-        text=True
-    )
+    # Collect in this interpreter: the core/agent/tools modules are already imported
+    tests_dir = Path(__file__).parent / 'tests'
+    with contextlib.redirect_stdout(io.StringIO()) as buf:
+        rc = pytest.main([str(tests_dir), "--co", "-q", "--no-header"])
     
-    if result.returncode == 0:
-        # Count tests
-        test_count = result.stdout.count("test_")
+    if rc == 0:
+        # Count collected node ids
+        test_count = buf.getvalue().count("::test_")
         print(f"  ✅ Found {test_count} tests")
         return True
     else:
@@ -170,21 +173,46 @@ def check_agent():
         return False
 
 
+# (--only key, summary name, check, needs importable modules)
+CHECKS = [
+    ("imports", "Imports", check_imports, False),
+    ("deps", "Dependencies", check_dependencies, False),
+    ("env", "Environment", check_environment, False),
+    ("engine", "Game Engine", check_game_engine, True),
+    ("agent", "Agent", check_agent, True),
+    ("tests", "Tests", check_tests, True),
+]
+
+
 def main():
     """Run all validation checks."""
+    # Support running a single section: --only=imports|deps|env|engine|agent|tests
+    only = None
+    for arg in sys.argv:
+        if arg.startswith("--only="):
+            only = arg.split("=")[1].lower()
+            if only not in [key for key, _, _, _ in CHECKS]:
+                print(f"❌ Unknown check '{only}'")
+                return 2
+    
     print("="*60)
     print("MTG Commander AI - Validation Check")
     print("="*60)
     
     results = []
-    
-    # Run checks
-    results.append(("Imports", check_imports()))
-    results.append(("Dependencies", check_dependencies()))
-    results.append(("Environment", check_environment()))
-    results.append(("Game Engine", check_game_engine()))
-    results.append(("Agent", check_agent()))
-    results.append(("Tests", check_tests()))
+    imports_ok = None
+    
+    # Run checks; engine/agent/tests are skipped once the modules fail to import
+    for key, name, check, needs_imports in CHECKS:
+        if only and key != only:
+            continue
+        if needs_imports and imports_ok is False:
+            results.append((name, None))
+            continue
+        result = check()
+        if key == "imports":
+            imports_ok = result
+        results.append((name, result))
     
     # Summary
     print("\n" + "="*60)
@@ -195,7 +223,10 @@ def main():
     total = len(results)
     
     for name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
+        if result is None:
+            status = "⏭️  SKIP (imports failed)"
+        else:
+            status = "✅ PASS" if result else "❌ FAIL"
         print(f"{name:20} {status}")
     
     print(f"\nTotal: {passed}/{total} checks passed")
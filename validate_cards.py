@@ -6,35 +6,157 @@ This script checks our card database against Scryfall to verify:
 - Mana costs match
 - Card types are accurate
 - Oracle text is similar (we have simplified versions)
+
+Scryfall responses are cached in .scryfall_cache/; pass --refresh to refetch.
 """
+import hashlib
+import json
+import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple, List, cast
 
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:  # Optional: faster parsing of Scryfall payloads and cache files
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson isn't installed
+    orjson = None  # type: ignore[assignment]
 from data.cards import create_basic_cards
 from core.card import CardType
 
 
 SCRYFALL_API = "https://api.scryfall.com/cards/named"
+SCRYFALL_COLLECTION_API = "https://api.scryfall.com/cards/collection"
+COLLECTION_BATCH_SIZE = 75  # Scryfall's limit on identifiers per collection request
 RATE_LIMIT_DELAY = 0.1  # 100ms between requests (Scryfall allows 10 req/sec)
+MAX_WORKERS = 8  # Concurrent lookups; the rate limiter still caps throughput
+CACHE_DIR = Path(__file__).parent / ".scryfall_cache"  # Responses from earlier runs
+
+
+def _json_loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _json_dumps(data: Any) -> bytes:
+    return orjson.dumps(data) if orjson else json.dumps(data).encode("utf-8")
+
+
+def _cache_path(card_name: str) -> Path:
+    key = hashlib.sha1(card_name.lower().encode()).hexdigest()
+    return CACHE_DIR / key[:2] / f"{key}.json"
+
+
+def load_cached(card_name: str) -> Optional[Dict[str, Any]]:
+    """Return the cached Scryfall card for card_name, if an earlier run saved one."""
+    path = _cache_path(card_name)
+    if not path.exists():
+        return None
+    return cast(Dict[str, Any], _json_loads(path.read_bytes()))
+
 
+def store_cached(card_name: str, data: Dict[str, Any]) -> None:
+    """Save a Scryfall card so later runs can skip the request."""
+    path = _cache_path(card_name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(_json_dumps(data))
 
-def query_scryfall(card_name: str) -> Optional[Dict[str, Any]]:
-    """Query Scryfall API for a card by name."""
+
+class RateLimiter:
+    """Hand out request slots at least `interval` seconds apart across threads."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def create_session() -> requests.Session:
+    """Create an HTTP session whose connection pool fits MAX_WORKERS threads."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+    session.mount("https://", adapter)
+    return session
+
+
+def query_scryfall(
+    session: requests.Session, card_name: str
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Query Scryfall API for a card by name.
+
+    Returns (card, error): card is None when Scryfall has no match, and error
+    describes an API error status for the caller to report.
+    """
     params = {"fuzzy": card_name}
-    response = requests.get(SCRYFALL_API, params=params, timeout=10)
+    response = session.get(SCRYFALL_API, params=params, timeout=10)
     
     if response.status_code == 200:
-        return cast(Dict[str, Any], response.json())
+        return cast(Dict[str, Any], _json_loads(response.content)), None
     elif response.status_code == 404:
-        return None
+        return None, None
     else:
-        print(f"  ⚠️  API error {response.status_code} for {card_name}")
-        return None
+        return None, f"API error {response.status_code} for {card_name}"
+
+
+def query_scryfall_collection(
+    session: requests.Session, card_names: List[str], limiter: RateLimiter
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch cards by exact name in batches of COLLECTION_BATCH_SIZE.
+
+    Returns the cards found keyed by lowercased name; double-faced cards are
+    also keyed by each face's name. Names Scryfall can't match, or that were
+    in a batch whose request failed, are left out.
+    """
+    by_name: Dict[str, Dict[str, Any]] = {}
+    for start in range(0, len(card_names), COLLECTION_BATCH_SIZE):
+        batch = card_names[start:start + COLLECTION_BATCH_SIZE]
+        limiter.wait()
+        # A failed batch is reported and skipped; its names fall through to the fuzzy lookups
+        try:
+            response = session.post(
+                SCRYFALL_COLLECTION_API,
+                json={"identifiers": [{"name": name} for name in batch]},
+                timeout=30,
+            )
+        except requests.RequestException as e:
+            print(f"  ⚠️  API error {e} for a batch of {len(batch)} cards")
+            continue
+        if response.status_code != 200:
+            print(f"  ⚠️  API error {response.status_code} for a batch of {len(batch)} cards")
+            continue
+        for data in _json_loads(response.content).get("data", []):
+            by_name[data["name"].lower()] = data
+            for face in data.get("card_faces", []):
+                by_name.setdefault(face["name"].lower(), data)
+    return by_name
+
+
+# Mana symbol -> cost bucket; hybrid/phyrexian/X symbols are ignored for now
+_MANA_SYMBOLS = {
+    "W": "white",
+    "U": "blue",
+    "B": "black",
+    "R": "red",
+    "G": "green",
+    "C": "generic",  # Colorless mana
+}
+_MANA_SYMBOL_RE = re.compile(r"\{([^}]+)\}")
 
 
 def parse_scryfall_mana_cost(mana_cost_str: str) -> Dict[str, int]:
@@ -44,29 +166,13 @@ def parse_scryfall_mana_cost(mana_cost_str: str) -> Dict[str, int]:
     
     cost = {"generic": 0, "white": 0, "blue": 0, "black": 0, "red": 0, "green": 0}
     
-    # Remove braces and split
-    symbols = mana_cost_str.replace("{", " ").replace("}", " ").split()
-    
-    for symbol in symbols:
-        symbol = symbol.strip()
-        if not symbol:
-            continue
-            
+    for symbol in _MANA_SYMBOL_RE.findall(mana_cost_str):
         if symbol.isdigit():
             cost["generic"] += int(symbol)
-        elif symbol == "W":
-            cost["white"] += 1
-        elif symbol == "U":
-            cost["blue"] += 1
-        elif symbol == "B":
-            cost["black"] += 1
-        elif symbol == "R":
-            cost["red"] += 1
-        elif symbol == "G":
-            cost["green"] += 1
-        elif symbol == "C":
-            cost["generic"] += 1  # Colorless mana
-        # Ignore hybrid/phyrexian symbols for now
+        else:
+            bucket = _MANA_SYMBOLS.get(symbol)
+            if bucket:
+                cost[bucket] += 1
     
     # Remove zero values
     return {k: v for k, v in cost.items() if v > 0}
@@ -100,24 +206,26 @@ def compare_mana_costs(our_cost, scryfall_cost_str: str) -> Tuple[bool, str]:
         return False, f"Ours: {our_dict}, Scryfall: {scryfall_parsed}"
 
 
+# Our card type -> word expected in Scryfall's type line
+_TYPE_WORDS = {
+    CardType.CREATURE: "creature",
+    CardType.INSTANT: "instant",
+    CardType.SORCERY: "sorcery",
+    CardType.ARTIFACT: "artifact",
+    CardType.ENCHANTMENT: "enchantment",
+    CardType.LAND: "land",
+    CardType.PLANESWALKER: "planeswalker",
+}
+_TYPE_LINE_WORD_RE = re.compile(r"[a-z]+")
+
+
 def validate_card_types(our_types: List[CardType], scryfall_types: str) -> Tuple[bool, str]:
     """Validate card types match."""
-    scryfall_lower = scryfall_types.lower()
-    
-    type_map = {
-        CardType.CREATURE: "creature",
-        CardType.INSTANT: "instant",
-        CardType.SORCERY: "sorcery",
-        CardType.ARTIFACT: "artifact",
-        CardType.ENCHANTMENT: "enchantment",
-        CardType.LAND: "land",
-        CardType.PLANESWALKER: "planeswalker",
-    }
+    scryfall_words = set(_TYPE_LINE_WORD_RE.findall(scryfall_types.lower()))
+    our_type_strings = [_TYPE_WORDS.get(t, str(t).lower()) for t in our_types]
     
-    our_type_strings = [type_map.get(t, str(t).lower()) for t in our_types]
-    
-    # Check if all our types are in Scryfall's type line
-    matches = all(t in scryfall_lower for t in our_type_strings)
+    # Check if all our types are whole words of Scryfall's type line
+    matches = scryfall_words.issuperset(our_type_strings)
     
     if matches:
         return True, "Types match"
@@ -125,8 +233,13 @@ def validate_card_types(our_types: List[CardType], scryfall_types: str) -> Tuple
         return False, f"Ours: {our_type_strings}, Scryfall: {scryfall_types}"
 
 
-def validate_cards() -> Tuple[int, int, int]:
-    """Validate all cards against Scryfall."""
+def validate_cards(refresh: bool = False) -> Tuple[int, int, int]:
+    """
+    Validate all cards against Scryfall.
+
+    Responses are cached under CACHE_DIR; refresh=True ignores the cache and
+    fetches every card again.
+    """
     cards = create_basic_cards()
     
     print(f"\n🔍 Validating {len(cards)} cards against Scryfall...")
@@ -139,20 +252,60 @@ def validate_cards() -> Tuple[int, int, int]:
     
     # Skip basic lands (they're fine)
     basic_lands = {"Plains", "Island", "Swamp", "Mountain", "Forest"}
+    to_check = [card for card in cards.values() if card.name not in basic_lands]
+    validated += total - len(to_check)
     
-    for card in cards.values():
-        if card.name in basic_lands:
-            validated += 1
-            continue
-        
-        print(f"\n📝 {card.name}")
-        
-        # Query Scryfall
-        scryfall_data = query_scryfall(card.name)
-        time.sleep(RATE_LIMIT_DELAY)  # Rate limiting
+    # Fetch everything by exact name in a few collection requests, then fall
+    # back to concurrent fuzzy lookups for the names that didn't match. The
+    # rate limiter keeps the combined request rate within Scryfall's limit.
+    limiter = RateLimiter(RATE_LIMIT_DELAY)
+    session = create_session()
+    
+    def lookup(name):
+        # One failed lookup must not abort the pool, so network errors become a message
+        limiter.wait()
+        try:
+            return query_scryfall(session, name)
+        except requests.RequestException as e:
+            return None, f"Request failed for {name}: {e}"
+    
+    names = list(dict.fromkeys(card.name for card in to_check))
+    by_name: Dict[str, Dict[str, Any]] = {}
+    lookup_errors: Dict[str, str] = {}
+    if not refresh:
+        for name in names:
+            data = load_cached(name)
+            if data:
+                by_name[name.lower()] = data
+    to_fetch = [name for name in names if name.lower() not in by_name]
+    
+    with session:
+        if to_fetch:
+            by_name.update(query_scryfall_collection(session, to_fetch, limiter))
+        unmatched = [name for name in to_fetch if name.lower() not in by_name]
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for name, (data, error) in zip(unmatched, executor.map(lookup, unmatched)):
+                if data:
+                    by_name[name.lower()] = data
+                elif error:
+                    lookup_errors[name] = error
+    
+    for name in to_fetch:
+        data = by_name.get(name.lower())
+        if data:
+            store_cached(name, data)
+    
+    # Comparison is purely in memory from here on, so the report is collected
+    # and written in one go rather than printed line by line
+    lines: List[str] = []
+    for card in to_check:
+        scryfall_data = by_name.get(card.name.lower())
+        lines.append(f"\n📝 {card.name}")
         
         if not scryfall_data:
-            print(f"  ❌ NOT FOUND on Scryfall!")
+            lines.append(f"  ❌ NOT FOUND on Scryfall!")
+            if card.name in lookup_errors:
+                lines.append(f"  ⚠️  {lookup_errors[card.name]}")
             errors += 1
             continue
         
@@ -161,9 +314,9 @@ def validate_cards() -> Tuple[int, int, int]:
         cost_match, cost_msg = compare_mana_costs(card.mana_cost, scryfall_mana)
         
         if cost_match:
-            print(f"  ✅ Mana cost: {scryfall_mana}")
+            lines.append(f"  ✅ Mana cost: {scryfall_mana}")
         else:
-            print(f"  ⚠️  Mana cost mismatch: {cost_msg}")
+            lines.append(f"  ⚠️  Mana cost mismatch: {cost_msg}")
             warnings += 1
         
         # Validate types
@@ -171,9 +324,9 @@ def validate_cards() -> Tuple[int, int, int]:
         types_match, types_msg = validate_card_types(card.card_types, scryfall_types)
         
         if types_match:
-            print(f"  ✅ Types: {scryfall_types}")
+            lines.append(f"  ✅ Types: {scryfall_types}")
         else:
-            print(f"  ⚠️  Type mismatch: {types_msg}")
+            lines.append(f"  ⚠️  Type mismatch: {types_msg}")
             warnings += 1
         
         # Check power/toughness for creatures
@@ -184,36 +337,38 @@ def validate_cards() -> Tuple[int, int, int]:
             if scryfall_power and scryfall_toughness:
                 if (str(card.power) == scryfall_power and 
                     str(card.toughness) == scryfall_toughness):
-                    print(f"  ✅ P/T: {scryfall_power}/{scryfall_toughness}")
+                    lines.append(f"  ✅ P/T: {scryfall_power}/{scryfall_toughness}")
                 else:
-                    print(f"  ⚠️  P/T mismatch: Ours {card.power}/{card.toughness}, "
-                          f"Scryfall {scryfall_power}/{scryfall_toughness}")
+                    lines.append(f"  ⚠️  P/T mismatch: Ours {card.power}/{card.toughness}, "
+                                 f"Scryfall {scryfall_power}/{scryfall_toughness}")
                     warnings += 1
         
         if cost_match and types_match:
             validated += 1
     
     # Summary
-    print("\n" + "=" * 70)
-    print(f"\n📊 VALIDATION SUMMARY")
-    print(f"Total cards:     {total}")
-    print(f"✅ Validated:    {validated} ({validated/total*100:.1f}%)")
-    print(f"⚠️  Warnings:     {warnings}")
-    print(f"❌ Errors:       {errors}")
+    lines.append("\n" + "=" * 70)
+    lines.append(f"\n📊 VALIDATION SUMMARY")
+    lines.append(f"Total cards:     {total}")
+    lines.append(f"✅ Validated:    {validated} ({validated/total*100:.1f}%)")
+    lines.append(f"⚠️  Warnings:     {warnings}")
+    lines.append(f"❌ Errors:       {errors}")
     
     if errors == 0 and warnings < 5:
-        print(f"\n🎉 Excellent! Card data is highly accurate!")
+        lines.append(f"\n🎉 Excellent! Card data is highly accurate!")
     elif errors == 0:
-        print(f"\n✅ Good! No errors, just minor warnings.")
+        lines.append(f"\n✅ Good! No errors, just minor warnings.")
     else:
-        print(f"\n⚠️  Some cards need attention.")
+        lines.append(f"\n⚠️  Some cards need attention.")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
     
     return validated, warnings, errors
 
 
 if __name__ == "__main__":
     try:
-        validate_cards()
+        validate_cards(refresh="--refresh" in sys.argv)
     except KeyboardInterrupt:
         print("\n\n⏸️  Validation interrupted by user")
     except Exception as e: